@@ -32,6 +32,7 @@ DATASF_APP_TOKEN = os.getenv("DATASF_APP_TOKEN", "")  # Optional but recommended
 REQUEST_TIMEOUT = 60
 MAX_RETRIES = 3
 RETRY_DELAY = 5
+MAX_CONCURRENT_FETCHES = 2  # Parallel requests allowed against upstream hosts
 
 # Data limits (DataSF paginates at 1000 by default)
 DATASF_PAGE_SIZE = 50000  # Max allowed with SoQL
@@ -1,9 +1,28 @@
 #!/usr/bin/env python3
 """Live integration test for SF Parking Data Pipeline"""
 import asyncio
+import io
 import json
 import sys
-from datetime import datetime
+import time
+
+try:
+    import orjson
+
+    def dumps(obj) -> bytes:
+        """Serialize to JSON bytes (orjson fast path, numpy arrays included)"""
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+except ImportError:
+    def dumps(obj) -> bytes:
+        """Serialize to JSON bytes (stdlib fallback)"""
+        return json.dumps(obj).encode()
+
+
+def _emit(out: io.StringIO):
+    """Write a test phase's buffered output in a single call"""
+    sys.stdout.write(out.getvalue())
+    sys.stdout.flush()
+
 
 # Test imports
 print("=" * 60)
@@ -17,65 +36,69 @@ try:
     from fetchers import BlockfaceFetcher, MetersFetcher, RPPAreasFetcher
     from transformers import ParkingDataTransformer
     from validators import DataValidator
+    from config import MAX_CONCURRENT_FETCHES
     print("  ✓ All modules imported successfully")
 except ImportError as e:
     print(f"  ✗ Import failed: {e}")
     sys.exit(1)
 
 
+async def _fetch_sample(fetcher_cls, sem: asyncio.Semaphore, limit: int = 5):
+    """Fetch a sample from one source, holding the shared concurrency slot"""
+    async with sem:
+        async with fetcher_cls() as fetcher:
+            return await fetcher.fetch_sample(limit=limit)
+
+
 async def test_fetchers():
     """Test 2: Fetch sample data from all sources"""
-    print()
-    print("[Test 2] Fetching sample data from all sources...")
+    out = io.StringIO()
+    print(file=out)
+    print("[Test 2] Fetching sample data from all sources...", file=out)
     results = {}
 
-    # Test Blockface fetcher
-    print("  • DataSF Blockface...")
-    try:
-        async with BlockfaceFetcher() as fetcher:
-            records = await fetcher.fetch_sample(limit=5)
-            results["blockface"] = records
-            print(f"    ✓ Fetched {len(records)} blockface records")
-            if records:
-                print(f"    Sample fields: {list(records[0].keys())[:5]}...")
-    except Exception as e:
-        print(f"    ✗ Blockface fetch failed: {e}")
-        results["blockface"] = []
-
-    # Test Meters fetcher
-    print("  • DataSF Meters...")
-    try:
-        async with MetersFetcher() as fetcher:
-            records = await fetcher.fetch_sample(limit=5)
-            results["meters"] = records
-            print(f"    ✓ Fetched {len(records)} meter records")
-            if records:
-                print(f"    Sample fields: {list(records[0].keys())[:5]}...")
-    except Exception as e:
-        print(f"    ✗ Meters fetch failed: {e}")
-        results["meters"] = []
-
-    # Test RPP Areas fetcher
-    print("  • SFMTA RPP Areas...")
-    try:
-        async with RPPAreasFetcher() as fetcher:
-            features = await fetcher.fetch_sample(limit=5)
-            results["rpp_areas"] = features
-            print(f"    ✓ Fetched {len(features)} RPP area features")
-            if features:
-                attrs = features[0].get("attributes", {})
-                print(f"    Sample attributes: {list(attrs.keys())[:5]}...")
-    except Exception as e:
-        print(f"    ✗ RPP Areas fetch failed: {e}")
-        results["rpp_areas"] = []
+    # Fetch concurrently, but cap in-flight requests so we stay polite to the upstream hosts
+    sem = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
+    sources = [
+        ("blockface", "DataSF Blockface", "blockface records", BlockfaceFetcher),
+        ("meters", "DataSF Meters", "meter records", MetersFetcher),
+        ("rpp_areas", "SFMTA RPP Areas", "RPP area features", RPPAreasFetcher),
+    ]
+    fetched = await asyncio.gather(
+        *(_fetch_sample(fetcher_cls, sem) for *_, fetcher_cls in sources),
+        return_exceptions=True,
+    )
 
+    for (key, label, noun, _), records in zip(sources, fetched):
+        print(f"  • {label}...", file=out)
+        if isinstance(records, Exception):
+            print(f"    ✗ {label} fetch failed: {records}", file=out)
+            results[key] = []
+            continue
+
+        results[key] = records
+        print(f"    ✓ Fetched {len(records)} {noun}", file=out)
+        if records and key == "rpp_areas":
+            attrs = records[0].get("attributes", {})
+            print(f"    Sample attributes: {list(attrs.keys())[:5]}...", file=out)
+        elif records:
+            print(f"    Sample fields: {list(records[0].keys())[:5]}...", file=out)
+
+    _emit(out)
     return results
 
 
 def test_transformer(raw_data):
     """Test 3: Transform data into normalized schema"""
-    print()
-    print("[Test 3] Transforming data...")
+    out = io.StringIO()
+    print(file=out)
+    print("[Test 3] Transforming data...", file=out)
+
+    # Nothing was fetched (offline / upstream outage) - skip the transformer entirely
+    if not any(raw_data.values()):
+        print("  ⚠ No data to transform - using empty bundle", file=out)
+        _emit(out)
+        return {"version": "empty", "zones": [], "meters": []}
 
     transformer = ParkingDataTransformer()
     transformed = {}
@@ -84,84 +107,87 @@ def test_transformer(raw_data):
     if raw_data.get("rpp_areas"):
         zones = transformer.transform_rpp_areas(raw_data["rpp_areas"])
         transformed["zones"] = zones
-        print(f"  ✓ Transformed {len(zones)} RPP zones")
+        print(f"  ✓ Transformed {len(zones)} RPP zones", file=out)
         if zones:
             z = zones[0]
-            print(f"    Sample zone: code={z.area_code}, name={z.name}")
+            print(f"    Sample zone: code={z.area_code}, name={z.name}", file=out)
     else:
         transformed["zones"] = []
-        print("  ⚠ No RPP areas to transform")
+        print("  ⚠ No RPP areas to transform", file=out)
 
     # Transform blockface
     if raw_data.get("blockface"):
         regulations = transformer.transform_blockface(raw_data["blockface"])
         transformed["regulations"] = regulations
-        print(f"  ✓ Transformed {len(regulations)} parking regulations")
+        print(f"  ✓ Transformed {len(regulations)} parking regulations", file=out)
         if regulations:
             r = regulations[0]
-            print(f"    Sample: {r.street_name} ({r.side}), RPP={r.rpp_area}")
+            print(f"    Sample: {r.street_name} ({r.side}), RPP={r.rpp_area}", file=out)
     else:
         transformed["regulations"] = []
-        print("  ⚠ No blockface data to transform")
+        print("  ⚠ No blockface data to transform", file=out)
 
     # Transform meters
     if raw_data.get("meters"):
         meters = transformer.transform_meters(raw_data["meters"])
         transformed["meters"] = meters
-        print(f"  ✓ Transformed {len(meters)} parking meters")
+        print(f"  ✓ Transformed {len(meters)} parking meters", file=out)
         if meters:
             m = meters[0]
-            print(f"    Sample: {m.post_id} at ({m.latitude:.4f}, {m.longitude:.4f})")
+            print(f"    Sample: {m.post_id} at ({m.latitude:.4f}, {m.longitude:.4f})", file=out)
     else:
         transformed["meters"] = []
-        print("  ⚠ No meter data to transform")
+        print("  ⚠ No meter data to transform", file=out)
 
     # Generate app data
-    print()
-    print("  Generating app data bundle...")
+    print(file=out)
+    print("  Generating app data bundle...", file=out)
     app_data = transformer.generate_app_data(
         zones=transformed["zones"],
         regulations=transformed["regulations"],
         meters=transformed["meters"]
     )
-    print(f"  ✓ Generated app data with version: {app_data.get('version')}")
-    print(f"    - {len(app_data.get('zones', []))} zones")
-    print(f"    - {len(app_data.get('meters', []))} meters")
+    print(f"  ✓ Generated app data with version: {app_data.get('version')}", file=out)
+    print(f"    - {len(app_data.get('zones', []))} zones", file=out)
+    print(f"    - {len(app_data.get('meters', []))} meters", file=out)
+    print(f"    - {len(dumps(app_data)) / 1024:.1f} KB serialized", file=out)
 
+    _emit(out)
     return app_data
 
 
 def test_validator(app_data):
     """Test 4: Validate data and test error catching"""
-    print()
-    print("[Test 4] Testing validator...")
+    out = io.StringIO()
+    print(file=out)
+    print("[Test 4] Testing validator...", file=out)
 
     validator = DataValidator()
 
     # Test with actual data
-    print("  • Validating transformed data...")
+    print("  • Validating transformed data...", file=out)
     result = validator.validate_app_data(app_data)
-    print(f"    Valid: {result.is_valid}")
+    print(f"    Valid: {result.is_valid}", file=out)
     if result.errors:
-        print(f"    Errors: {len(result.errors)}")
+        print(f"    Errors: {len(result.errors)}", file=out)
         for e in result.errors[:3]:
-            print(f"      - {e}")
+            print(f"      - {e}", file=out)
     if result.warnings:
-        print(f"    Warnings: {len(result.warnings)}")
+        print(f"    Warnings: {len(result.warnings)}", file=out)
         for w in result.warnings[:3]:
-            print(f"      - {w}")
+            print(f"      - {w}", file=out)
 
     # Test with invalid data (should catch errors)
-    print()
-    print("  • Testing error catching with invalid data...")
+    print(file=out)
+    print("  • Testing error catching with invalid data...", file=out)
 
     # Missing version
     invalid_data = {"zones": [], "meters": []}
     result = validator.validate_app_data(invalid_data)
     if not result.is_valid and any("version" in e for e in result.errors):
-        print("    ✓ Caught missing 'version' field")
+        print("    ✓ Caught missing 'version' field", file=out)
     else:
-        print("    ✗ Failed to catch missing version")
+        print("    ✗ Failed to catch missing version", file=out)
 
     # Invalid coordinates
     invalid_coords = {
@@ -171,9 +197,9 @@ def test_validator(app_data):
     }
     result = validator.validate_app_data(invalid_coords)
     if any("outside SF bounds" in w for w in result.warnings):
-        print("    ✓ Caught coordinates outside SF bounds")
+        print("    ✓ Caught coordinates outside SF bounds", file=out)
     else:
-        print("    ✗ Failed to catch invalid coordinates")
+        print("    ✗ Failed to catch invalid coordinates", file=out)
 
     # Unknown RPP area
     invalid_zone = {
@@ -183,10 +209,11 @@ def test_validator(app_data):
     }
     result = validator.validate_app_data(invalid_zone)
     if any("Unknown RPP area" in w for w in result.warnings):
-        print("    ✓ Caught unknown RPP area code")
+        print("    ✓ Caught unknown RPP area code", file=out)
     else:
-        print("    ✗ Failed to catch unknown RPP area")
+        print("    ✗ Failed to catch unknown RPP area", file=out)
 
+    _emit(out)
     return True
 
 
@@ -226,7 +253,7 @@ def test_scheduler():
 
 async def main():
     """Run all tests"""
-    start_time = datetime.now()
+    start_ns = time.perf_counter_ns()
     all_passed = True
 
     # Test 2: Fetch data
@@ -248,7 +275,7 @@ async def main():
         all_passed = False
 
     # Summary
-    duration = (datetime.now() - start_time).total_seconds()
+    duration = (time.perf_counter_ns() - start_ns) / 1e9
     print()
     print("=" * 60)
     print(f"Tests completed in {duration:.1f}s")
@@ -1,6 +1,9 @@
 """Tests for data fetchers"""
 import pytest
 import asyncio
+import re
+
+from aioresponses import aioresponses
 
 # Add parent directory to path for imports
 import sys
@@ -9,10 +12,34 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from fetchers import BlockfaceFetcher, MetersFetcher, RPPAreasFetcher
 
+# Canned upstream responses for the stubbed (offline) tests
+BLOCKFACE_FIXTURE = [
+    {"cnn": "1234000", "street": "MAIN ST", "rpparea1": "A", "hrlimit": "2"},
+    {"cnn": "1235000", "street": "MARKET ST", "rpparea1": "B", "hrlimit": "1"},
+]
+METERS_FIXTURE = [
+    {"post_id": "TEST001", "latitude": "37.7749", "longitude": "-122.4194", "cap_color": "Grey"},
+    {"post_id": "TEST002", "latitude": "37.7750", "longitude": "-122.4195", "cap_color": "Green"},
+]
+RPP_AREAS_FIXTURE = {
+    "features": [
+        {
+            "attributes": {"AREA": "A", "NAME": "Area A"},
+            "geometry": {"rings": [[[-122.4, 37.7], [-122.4, 37.8], [-122.3, 37.8], [-122.4, 37.7]]]},
+        }
+    ]
+}
+
+
+def _url_pattern(base_url: str) -> re.Pattern:
+    """Match a fetcher URL regardless of its query string"""
+    return re.compile(rf"^{re.escape(base_url)}(\?.*)?$")
+
 
 class TestBlockfaceFetcher:
     """Tests for BlockfaceFetcher"""
 
+    @pytest.mark.integration
     @pytest.mark.asyncio
     async def test_fetch_sample(self):
         """Test fetching a sample of blockface data"""
@@ -27,6 +54,17 @@ class TestBlockfaceFetcher:
                 record = records[0]
                 assert "street" in record or "cnn" in record  # At least one identifier
 
+    @pytest.mark.asyncio
+    async def test_fetch_sample_stubbed(self):
+        """Test fetching a sample against a canned blockface response"""
+        fetcher = BlockfaceFetcher()
+        with aioresponses() as m:
+            m.get(_url_pattern(fetcher.base_url), payload=BLOCKFACE_FIXTURE)
+            async with fetcher:
+                records = await fetcher.fetch_sample(limit=10)
+
+        assert records == BLOCKFACE_FIXTURE
+
     @pytest.mark.asyncio
     async def test_source_name(self):
         """Test source name is set correctly"""
@@ -37,6 +75,7 @@ class TestBlockfaceFetcher:
 class TestMetersFetcher:
     """Tests for MetersFetcher"""
 
+    @pytest.mark.integration
     @pytest.mark.asyncio
     async def test_fetch_sample(self):
         """Test fetching a sample of meter data"""
@@ -56,6 +95,18 @@ class TestMetersFetcher:
                 )
                 assert has_location
 
+    @pytest.mark.asyncio
+    async def test_fetch_sample_stubbed(self):
+        """Test fetching a sample against a canned meters response"""
+        fetcher = MetersFetcher()
+        with aioresponses() as m:
+            m.get(_url_pattern(fetcher.base_url), payload=METERS_FIXTURE)
+            async with fetcher:
+                records = await fetcher.fetch_sample(limit=10)
+
+        assert len(records) == 2
+        assert records[0]["post_id"] == "TEST001"
+
     @pytest.mark.asyncio
     async def test_source_name(self):
         """Test source name is set correctly"""
@@ -66,6 +117,7 @@ class TestMetersFetcher:
 class TestRPPAreasFetcher:
     """Tests for RPPAreasFetcher"""
 
+    @pytest.mark.integration
     @pytest.mark.asyncio
     async def test_fetch_sample(self):
         """Test fetching a sample of RPP area data"""
@@ -80,6 +132,18 @@ class TestRPPAreasFetcher:
                 # ArcGIS features should have attributes and geometry
                 assert "attributes" in feature or "geometry" in feature
 
+    @pytest.mark.asyncio
+    async def test_fetch_sample_stubbed(self):
+        """Test fetching a sample against a canned ArcGIS response"""
+        fetcher = RPPAreasFetcher()
+        with aioresponses() as m:
+            m.get(_url_pattern(fetcher.base_url), payload=RPP_AREAS_FIXTURE)
+            async with fetcher:
+                features = await fetcher.fetch_sample(limit=5)
+
+        assert len(features) == 1
+        assert features[0]["attributes"]["AREA"] == "A"
+
     @pytest.mark.asyncio
     async def test_source_name(self):
         """Test source name is set correctly"""
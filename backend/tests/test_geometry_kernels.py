@@ -0,0 +1,114 @@
+"""Tests for geometry kernels"""
+import pytest
+
+# Add parent directory to path for imports
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from transformers import ParkingDataTransformer
+from transformers.geometry_kernels import monotone_chain, point_in_ring, point_in_polygon, _monotone_chain_jit, _monotone_chain_py
+
+import numpy as np
+
+
+SQUARE = np.array([[0.0, 0.0], [1.0, 0.0], [1.0, 1.0], [0.0, 1.0], [0.0, 0.0]])
+
+
+class TestPointInRing:
+    """Tests for the ray-casting kernel"""
+
+    def test_inside(self):
+        """Test a point inside the ring"""
+        assert point_in_ring(0.5, 0.5, SQUARE)
+
+    def test_outside(self):
+        """Test points outside the ring"""
+        assert not point_in_ring(1.5, 0.5, SQUARE)
+        assert not point_in_ring(0.5, -0.1, SQUARE)
+
+
+class TestMonotoneChain:
+    """Tests for the convex hull kernel"""
+
+    def test_square_with_interior_point(self):
+        """Test interior and collinear edge points are dropped"""
+        points = np.unique(np.array([
+            [0.0, 0.0], [2.0, 0.0], [2.0, 2.0], [0.0, 2.0], [1.0, 1.0], [1.0, 0.0],
+        ]), axis=0)
+
+        hull = points[monotone_chain(points)]
+
+        assert sorted(map(tuple, hull.tolist())) == [(0.0, 0.0), (0.0, 2.0), (2.0, 0.0), (2.0, 2.0)]
+        assert hull[0].tolist() == [0.0, 0.0]
+        assert hull[1].tolist() == [2.0, 0.0]  # Counter-clockwise
+
+    def test_implementations_agree(self):
+        """Test the array and list implementations return the same hull"""
+        points = np.unique(np.random.default_rng(0).random((200, 2)), axis=0)
+
+        assert _monotone_chain_jit(points).tolist() == _monotone_chain_py(points).tolist()
+
+    def test_collinear(self):
+        """Test collinear points reduce to their endpoints"""
+        points = np.array([[0.0, 0.0], [1.0, 1.0], [2.0, 2.0]])
+
+        assert len(monotone_chain(points)) == 2
+
+
+class TestPointInPolygon:
+    """Tests for bbox-gated zone lookups"""
+
+    def test_zone_lookup(self):
+        """Test lookup against a transformed RPP zone"""
+        zones = ParkingDataTransformer().transform_rpp_areas([
+            {
+                "attributes": {"AREA": "A"},
+                "geometry": {"rings": [[[-122.4, 37.7], [-122.3, 37.7], [-122.3, 37.8], [-122.4, 37.8], [-122.4, 37.7]]]},
+            }
+        ])
+        zone = zones[0]
+
+        assert zone.bbox == pytest.approx((-122.4, 37.7, -122.3, 37.8))
+        assert point_in_polygon(-122.35, 37.75, zone.polygon, zone.bbox)
+        assert not point_in_polygon(-122.0, 37.75, zone.polygon, zone.bbox)
+
+    def test_derived_zone_lookup(self):
+        """Test lookup against zones derived from blockfaces and rebuilt by overlap cleanup"""
+        pytest.importorskip("shapely")
+        zones = ParkingDataTransformer().derive_zones_from_blockface([
+            {"rpparea1": "A", "shape": {"type": "LineString", "coordinates": [[-122.40, 37.70], [-122.40, 37.701]]}},
+            {"rpparea1": "B", "shape": {"type": "LineString", "coordinates": [[-122.41, 37.70], [-122.39, 37.70]]}},
+        ])
+
+        for zone in zones:
+            assert zone.bbox == ParkingDataTransformer()._polygon_bbox(zone.polygon)
+        zone_a, zone_b = zones
+        assert point_in_polygon(-122.40, 37.7005, zone_a.polygon, zone_a.bbox, holes=False)
+        assert point_in_polygon(-122.395, 37.70, zone_b.polygon, zone_b.bbox, holes=False)
+        assert not point_in_polygon(-122.395, 37.70, zone_a.polygon, zone_a.bbox, holes=False)
+
+    def test_overlapping_block_faces(self):
+        """Test a point covered by two block-face polygons of one derived zone is inside"""
+        pytest.importorskip("shapely")
+        zones = ParkingDataTransformer().derive_zones_from_blockface([
+            {"rpparea1": "A", "shape": {"type": "LineString", "coordinates": [[-122.40, 37.70], [-122.40, 37.701]]}},
+            {"rpparea1": "A", "rpparea2": "B", "shape": {"type": "LineString", "coordinates": [[-122.401, 37.7005], [-122.399, 37.7005]]}},
+        ])
+        zone_a = zones[0]
+
+        assert len(zone_a.polygon) == 2  # Different multi-permit signatures are not merged
+        assert point_in_polygon(-122.40, 37.7005, zone_a.polygon, zone_a.bbox, holes=False)
+
+    def test_hole(self):
+        """Test a point inside a hole ring is outside the polygon"""
+        outer = np.array([[0.0, 0.0], [4.0, 0.0], [4.0, 4.0], [0.0, 4.0], [0.0, 0.0]])
+        hole = np.array([[1.0, 1.0], [1.0, 3.0], [3.0, 3.0], [3.0, 1.0], [1.0, 1.0]])
+        bbox = (0.0, 0.0, 4.0, 4.0)
+
+        assert not point_in_polygon(2.0, 2.0, [outer, hole], bbox)
+        assert point_in_polygon(0.5, 0.5, [outer, hole], bbox)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -1,5 +1,6 @@
 """Tests for data transformer"""
 import pytest
+from unittest.mock import patch
 
 # Add parent directory to path for imports
 import sys
@@ -40,6 +41,53 @@ class TestParkingDataTransformer:
         assert len(zones[0].polygon) == 1
         assert len(zones[0].polygon[0]) == 5  # 5 coordinates (closed ring)
 
+    def test_transform_rpp_areas_from_generator(self):
+        """Test features can be streamed from a generator"""
+        ring = [[-122.4, 37.7], [-122.3, 37.7], [-122.3, 37.8]]
+        features = ({"attributes": {"AREA": code}, "geometry": {"rings": [ring]}} for code in "ABC")
+
+        zones = self.transformer.transform_rpp_areas(features)
+
+        assert [z.area_code for z in zones] == ["A", "B", "C"]
+        assert self.transformer.transform_rpp_areas(iter([])) == []
+
+    def test_transform_rpp_areas_mixed_area_keys(self):
+        """Test area codes are found when later features use a different key"""
+        ring = [[-122.4, 37.7], [-122.3, 37.7], [-122.3, 37.8]]
+        raw_areas = [
+            {"attributes": {"AREA": "a"}, "geometry": {"rings": [ring]}},
+            {"attributes": {"RPP_AREA": "b"}, "geometry": {"rings": [ring]}},
+        ]
+
+        zones = self.transformer.transform_rpp_areas(raw_areas)
+
+        assert [z.area_code for z in zones] == ["A", "B"]
+
+    def test_transform_rpp_areas_drops_z_values(self):
+        """Test RPP area rings keep only (lon, lat) and serialize as plain lists"""
+        raw_areas = [
+            {
+                "attributes": {"AREA": "a"},
+                "geometry": {
+                    "rings": [
+                        [[-122.4, 37.7, 0.0], [-122.4, 37.8, 0.0], [-122.3, 37.8, 0.0], [-122.4, 37.7, 0.0]]
+                    ]
+                }
+            }
+        ]
+
+        zones = self.transformer.transform_rpp_areas(raw_areas)
+        app_data = self.transformer.generate_app_data(zones, [], [])
+
+        assert zones[0].area_code == "A"
+        assert app_data["zones"][0]["polygon"][0][1] == [-122.4, 37.8]
+
+        # Ragged ring mixing 2D and 3D coordinates
+        raw_areas[0]["geometry"]["rings"][0][1] = [-122.4, 37.8]
+        zones = self.transformer.transform_rpp_areas(raw_areas)
+        app_data = self.transformer.generate_app_data(zones, [], [])
+        assert app_data["zones"][0]["polygon"][0] == [[-122.4, 37.7], [-122.4, 37.8], [-122.3, 37.8], [-122.4, 37.7]]
+
     def test_transform_rpp_areas_missing_geometry(self):
         """Test handling of areas without geometry"""
         raw_areas = [
@@ -52,6 +100,153 @@ class TestParkingDataTransformer:
         zones = self.transformer.transform_rpp_areas(raw_areas)
         assert len(zones) == 0  # Should skip areas without geometry
 
+    def test_derive_zones_from_blockface(self):
+        """Test blockface lines are buffered into per-area coordinate rings"""
+        pytest.importorskip("shapely")
+        raw_blockfaces = [
+            {"rpparea1": "A", "shape": {"type": "LineString", "coordinates": [[-122.40, 37.70], [-122.40, 37.701]]}},
+            {"rpparea1": "B", "rpparea2": "A", "shape": {"type": "LineString", "coordinates": [[-122.39, 37.70], [-122.39, 37.701]]}},
+            # Same block face again (another regulation row) - not duplicated
+            {"rpparea1": "A", "shape": {"type": "LineString", "coordinates": [[-122.40, 37.70], [-122.40, 37.701]]}},
+        ]
+
+        zones = self.transformer.derive_zones_from_blockface(raw_blockfaces)
+
+        assert [z.area_code for z in zones] == ["A", "B"]
+        assert len(zones[0].polygon) == 2
+        assert zones[1].multi_permit_polygons == {0: ["A", "B"]}
+        ring = self.transformer._polygon_to_list(zones[0].polygon)[0]
+        assert len(ring[0]) == 2
+        assert ring[0] == ring[-1]
+
+    def test_derive_zones_from_blockface_merges_repeated_areas(self):
+        """Test a block face repeated under more areas is tagged with all of them everywhere"""
+        pytest.importorskip("shapely")
+        line = {"type": "LineString", "coordinates": [[-122.40, 37.70], [-122.40, 37.701]]}
+        raw_blockfaces = [
+            {"rpparea1": "A", "shape": line},
+            {"rpparea1": "A", "rpparea2": "B", "shape": dict(line)},
+        ]
+
+        zones = self.transformer.derive_zones_from_blockface(raw_blockfaces)
+
+        assert [(z.area_code, z.total_blocks) for z in zones] == [("A", 1), ("B", 1)]
+        assert zones[0].multi_permit_polygons == {0: ["A", "B"]}
+        assert zones[1].multi_permit_polygons == {0: ["A", "B"]}
+
+    def test_buffer_geometries(self):
+        """Test lines are buffered in one batch; unbufferable geometries map to None"""
+        pytest.importorskip("shapely")
+        geoms = [
+            {"type": "LineString", "coordinates": [[0.0, 0.0], [1.0, 0.0]]},
+            {"type": "Point", "coordinates": [0.0, 0.0]},
+            {"type": "MultiLineString", "coordinates": [[[0.0, 0.0], [1.0, 0.0]], [[1.0, 0.0], [1.0, 1.0]]]},
+            "LINESTRING (0 0, 1 1)",
+        ]
+
+        rings = self.transformer._buffer_geometries(geoms, 0.1)
+
+        assert rings[1] is None and rings[3] is None
+        assert rings[0].shape == (5, 2)
+        assert rings[0].min(axis=0).tolist() == pytest.approx([0.0, -0.1])
+        assert rings[2].max(axis=0).tolist() == pytest.approx([1.1, 1.0])
+
+    def test_merge_polygon_groups(self):
+        """Test each group is unioned on its own; groups never merge into each other"""
+        pytest.importorskip("shapely")
+        square = [(0.0, 0.0), (1.0, 0.0), (1.0, 1.0), (0.0, 1.0), (0.0, 0.0)]
+        shifted = [(0.5, 0.0), (1.5, 0.0), (1.5, 1.0), (0.5, 1.0), (0.5, 0.0)]
+
+        merged = self.transformer._merge_polygon_groups([[square, shifted], [square], [[(0.0, 0.0), (1.0, 1.0)]]])
+
+        assert len(merged[0]) == 1
+        assert merged[0][0].max(axis=0).tolist() == [1.5, 1.0]
+        assert merged[1][0].max(axis=0).tolist() == [1.0, 1.0]
+        assert merged[2] == [[(0.0, 0.0), (1.0, 1.0)]]  # Unmergeable group returned unchanged
+
+    def test_split_different_zone_overlaps(self):
+        """Test overlapping polygons from different zones are split apart"""
+        shapely_geometry = pytest.importorskip("shapely.geometry")
+        from transformers.parking_transformer import RPPZone
+
+        zones = [
+            RPPZone(area_code="A", name="A", polygon=[[(0.0, 0.0), (2.0, 0.0), (2.0, 1.0), (0.0, 1.0), (0.0, 0.0)]]),
+            RPPZone(area_code="B", name="B", polygon=[[(1.0, 0.0), (3.0, 0.0), (3.0, 1.0), (1.0, 1.0), (1.0, 0.0)]]),
+            RPPZone(area_code="C", name="C", polygon=[[(5.0, 5.0), (6.0, 5.0), (6.0, 6.0), (5.0, 5.0)]]),
+        ]
+
+        result = self.transformer._split_different_zone_overlaps(zones)
+
+        poly_a, poly_b = (shapely_geometry.Polygon(z.polygon[0]) for z in result[:2])
+        assert poly_a.intersection(poly_b).area == pytest.approx(0.0)
+        assert poly_a.area == pytest.approx(1.5)
+        assert poly_b.area == pytest.approx(1.5)
+        assert self.transformer._polygon_to_list(result[2].polygon) == self.transformer._polygon_to_list(zones[2].polygon)
+
+    def test_split_different_zone_overlaps_sliver(self):
+        """Test a thin overlap whose clipped half degenerates is still split like the baseline"""
+        shapely_geometry = pytest.importorskip("shapely.geometry")
+        from transformers.parking_transformer import RPPZone
+
+        # Buffered block faces from generated data; clipping their overlap by
+        # rectangle (instead of intersecting with a box) left a 3-point ring
+        ring_a = [
+            (-122.432593709029, 37.76389087733895), (-122.43389068110184, 37.76510074281286),
+            (-122.43383950051788, 37.76516883088961), (-122.43254159973495, 37.764393494185114),
+            (-122.43263391082033, 37.76423896695931), (-122.43282597246751, 37.76435370026292),
+            (-122.43247092655754, 37.764022499771315), (-122.432593709029, 37.76389087733895),
+        ]
+        ring_b = [
+            (-122.43378595551758, 37.76513800702638), (-122.43370472370484, 37.765009800959476),
+            (-122.43379319171427, 37.765009800959476), (-122.43357686220705, 37.76480800046796),
+            (-122.43347260525015, 37.76464345441219), (-122.43362465411248, 37.764547115720795),
+            (-122.43393800437991, 37.76504166833499), (-122.43378595551758, 37.76513800702638),
+        ]
+        zones = [RPPZone(area_code="A", name="A", polygon=[ring_a]), RPPZone(area_code="B", name="B", polygon=[ring_b])]
+
+        result = self.transformer._split_different_zone_overlaps(zones)
+
+        # Areas produced by the baseline (box-intersection) split
+        poly_a, poly_b = (shapely_geometry.Polygon(z.polygon[0]) for z in result)
+        assert poly_a.area == pytest.approx(4.093886177086223e-07, rel=1e-9)
+        assert poly_b.area == pytest.approx(9.096857538552391e-08, rel=1e-9)
+        assert poly_a.intersection(poly_b).area == pytest.approx(0.0, abs=1e-15)
+
+    def test_derive_zones_convex_hull(self):
+        """Test the hull fallback counts block faces, not coordinates"""
+        line = {"type": "LineString", "coordinates": [[0.0, 0.0], [2.0, 0.0], [2.0, 2.0], [0.0, 2.0]]}
+        raw_blockfaces = [
+            {"rpparea1": "a", "RPPAREA1": "A", "shape": line},
+            {"rpparea1": "A", "rpparea2": "B", "shape": line},
+        ]
+
+        zones = self.transformer._derive_zones_convex_hull(raw_blockfaces)
+
+        assert [(z.area_code, z.total_blocks) for z in zones] == [("A", 2), ("B", 1)]
+
+    def test_flatten_coords(self):
+        """Test nested coordinates flatten in order, including deep nesting"""
+        coords = []
+        self.transformer._flatten_coords([[[1, 2], [3, 4]], [], [[5, 6, 7]]], coords)
+        assert coords == [(1.0, 2.0), (3.0, 4.0), (5.0, 6.0)]
+
+        deep = [0.0, 1.0]
+        for _ in range(2000):
+            deep = [deep]
+        coords = []
+        self.transformer._flatten_coords(deep, coords)
+        assert coords == [(0.0, 1.0)]
+
+    def test_create_convex_hull(self):
+        """Test hull creation from duplicated and interior points"""
+        coords = [(0.0, 0.0), (2.0, 0.0), (2.0, 2.0), (0.0, 2.0), (1.0, 1.0), (2.0, 2.0)]
+
+        hull = self.transformer._create_convex_hull(coords)
+
+        assert hull[0] == hull[-1]
+        assert sorted(set(hull)) == [(0.0, 0.0), (0.0, 2.0), (2.0, 0.0), (2.0, 2.0)]
+        assert self.transformer._create_convex_hull([(0.0, 0.0), (1.0, 1.0), (2.0, 2.0)]) is None
+
     def test_transform_blockface(self):
         """Test blockface transformation"""
         raw_blockfaces = [
@@ -72,6 +267,56 @@ class TestParkingDataTransformer:
         assert regulations[0].rpp_area == "A"
         assert regulations[0].time_limit == 120  # 2 hours = 120 minutes
 
+    def test_transform_blockface_upper_case_keys(self):
+        """Test ArcGIS-style upper-case field names"""
+        raw_blockfaces = [
+            {"STREET": "MAIN ST", "RPP_AREA": "Q", "HRLIMIT": "2", "DAYS": "MON,FRI", "HRS_BEGIN": "800"},
+        ]
+
+        regulations = self.transformer.transform_blockface(raw_blockfaces)
+
+        assert regulations[0].street_name == "MAIN ST"
+        assert regulations[0].rpp_area == "Q"
+        assert regulations[0].time_limit == 120
+        assert regulations[0].days == ("MON", "FRI")
+        assert regulations[0].hours_begin == "800"
+
+    def test_transform_blockface_mixed_case_keys(self):
+        """Test key casing is resolved per record, not per batch"""
+        raw_blockfaces = [
+            {"OBJECTID": 1, "street": "MAIN", "rpparea1": "a", "hrlimit": "2", "days": "M,T"},
+            {"street": "ELM", "RPPAREA1": "B"},
+        ]
+
+        regulations = self.transformer.transform_blockface(raw_blockfaces)
+
+        assert regulations[0].street_name == "MAIN"
+        assert regulations[0].rpp_area == "a"
+        assert regulations[0].time_limit == 120
+        assert regulations[0].days == ("M", "T")
+        assert regulations[1].street_name == "ELM"
+        assert regulations[1].rpp_area == "B"
+
+    def test_transform_blockface_grouped(self):
+        """Test grouped transform indexes regulations by upper-cased RPP area"""
+        raw_blockfaces = [
+            {"street": "MAIN ST", "rpparea1": "a", "hrlimit": "2"},
+            {"street": "OAK ST"},
+            {"street": "PINE ST", "rpparea1": "A", "hrlimit": "1"},
+        ]
+
+        regulations, area_index = self.transformer.transform_blockface(raw_blockfaces, group=True)
+
+        assert len(regulations) == 3
+        assert area_index == {"A": [0, 2]}
+
+        zones = self.transformer.transform_rpp_areas([
+            {"attributes": {"AREA": "A"}, "geometry": {"rings": [[[-122.4, 37.7], [-122.4, 37.8], [-122.3, 37.8]]]}}
+        ])
+        grouped = self.transformer.generate_app_data(zones, regulations, [], regulation_index=area_index)
+        scanned = self.transformer.generate_app_data(zones, regulations, [])
+        assert grouped["zones"] == scanned["zones"]
+
     def test_transform_meters(self):
         """Test meter transformation"""
         raw_meters = [
@@ -93,6 +338,103 @@ class TestParkingDataTransformer:
         assert meters[0].cap_color == "Grey"
         assert meters[0].time_limit == 60  # Grey = 60 minutes
 
+    def test_transform_malformed_records(self):
+        """Test malformed values are skipped or coerced without aborting the batch"""
+        zones = self.transformer.transform_rpp_areas([
+            {"attributes": {"AREA": "A"}, "geometry": {"rings": [[1, 2, 3]]}},  # Not coordinate pairs
+            {"attributes": None, "geometry": None},
+        ])
+        regulations = self.transformer.transform_blockface([
+            {"street": "Main St", "hrlimit": "inf", "days": ["M", "F"]},
+            {"street": "Oak St", "hrlimit": float("inf")},
+            {"street": "Elm St", "time_limit": float("-inf")},
+        ])
+        meters = self.transformer.transform_meters([
+            {"post_id": "M1", "latitude": "37.78", "longitude": "-122.40", "cap_color": 7},
+        ])
+
+        assert zones == []
+        assert self.transformer.get_stats()["errors"] == 1
+        assert regulations[0].street_name == "Main St"
+        assert [(r.street_name, r.time_limit) for r in regulations[1:]] == [("Oak St", None), ("Elm St", None)]
+        assert meters[0].time_limit is None
+
+    def test_transform_meters_point_fallback(self):
+        """Test meter coordinates fall back to the point geometry"""
+        raw_meters = [
+            {"post_id": "P1", "point": {"latitude": "37.78", "longitude": "-122.40"}},
+            {"post_id": "P2"},  # No coordinates anywhere - skipped
+            {"post_id": "P3", "latitude": "n/a", "longitude": "-122.40"},  # Unparsable, no point - skipped
+            # Missing or unparsable latitude takes both coordinates from the point
+            {"post_id": "P4", "latitude": None, "longitude": "-1.0", "point": {"latitude": "37.79", "longitude": "-122.41"}},
+            {"post_id": "P5", "latitude": "n/a", "longitude": "-1.0", "point": {"latitude": "37.79", "longitude": "-122.41"}},
+            # A real zero is a parsed coordinate, not a missing one
+            {"post_id": "P6", "latitude": 0, "longitude": "-1.0", "point": {"latitude": "37.79", "longitude": "-122.41"}},
+        ]
+
+        meters = self.transformer.transform_meters(raw_meters)
+
+        assert [m.post_id for m in meters] == ["P1", "P4", "P5", "P6"]
+        assert meters[0].latitude == pytest.approx(37.78)
+        assert [(m.latitude, m.longitude) for m in meters[1:3]] == [(37.79, -122.41)] * 2
+        assert (meters[3].latitude, meters[3].longitude) == (0.0, -1.0)
+
+    def test_group_meters_by_cell(self):
+        """Test meters group by truncated grid cell, in order of first appearance"""
+        from transformers.parking_transformer import ParkingMeter
+
+        def meter(post_id, lat, lon):
+            return ParkingMeter(post_id, lat, lon, "Main St", None, "Grey", 60, None)
+
+        meters = [meter("A", 37.7501, -122.4001), meter("B", 37.7601, -122.4001), meter("C", 37.7502, -122.4004)]
+
+        cells = self.transformer._group_meters_by_cell(meters, 0.0005)
+
+        assert [[m.post_id for m in cell_meters] for cell_meters, _ in cells] == [["A", "C"], ["B"]]
+        assert cells[0][1] == pytest.approx((-122.4004, 37.7501, -122.4001, 37.7502))
+
+    def test_merge_metered_zones(self):
+        """Test touching rectangles merge and pool the metadata of every contributing zone"""
+        pytest.importorskip("shapely")
+        from transformers.parking_transformer import MeteredZone
+
+        def rect_zone(zone_id, x, meter_count, time_limit, cap_colors=("Grey",), rate_area=None):
+            ring = [(x, 0.0), (x + 1.0, 0.0), (x + 1.0, 1.0), (x, 1.0), (x, 0.0)]
+            return MeteredZone(zone_id, zone_id, [ring], meter_count, list(cap_colors), time_limit, rate_area)
+
+        zones = [
+            rect_zone("Z1", 0.0, 2, 60, ("Yellow", "Grey"), "Area 5"),
+            rect_zone("Z2", 1.0, 3, 120, ("Grey", "Green"), "Area 1"),
+            rect_zone("Z3", 5.0, 4, None),
+        ]
+
+        merged = self.transformer._merge_metered_zones(zones)
+
+        assert sorted((z.meter_count, z.avg_time_limit) for z in merged) == [(4, None), (5, 90)]
+        # Pooled colors and rate area follow contributing-zone order, independent of hash seed
+        pooled = next(z for z in merged if z.meter_count == 5)
+        assert pooled.cap_colors == ["Yellow", "Grey", "Green"]
+        assert pooled.rate_area == "Area 5"
+
+    def test_derive_metered_zones_cache(self, tmp_path):
+        """Test derived metered zones are reused from the cache for unchanged meters"""
+        pytest.importorskip("shapely")
+        from transformers.parking_transformer import ParkingMeter
+
+        meters = [
+            ParkingMeter("A", 37.7501, -122.4001, "Main St", None, "Grey", 60, None),
+            ParkingMeter("B", 37.7502, -122.4004, "Main St", None, "Grey", 60, None),
+        ]
+
+        zones = self.transformer.derive_metered_zones_from_meters(meters, cache_dir=tmp_path)
+        assert len(list(tmp_path.glob("metered_zones_*.pkl"))) == 1
+
+        # Derivation (and its zone merge) must not run again
+        with patch.object(self.transformer, "_merge_metered_zones") as merge:
+            cached = self.transformer.derive_metered_zones_from_meters(meters, cache_dir=tmp_path)
+        merge.assert_not_called()
+        assert [(z.zone_id, z.meter_count) for z in cached] == [(z.zone_id, z.meter_count) for z in zones]
+
     def test_parse_time_limit_hours(self):
         """Test time limit parsing for hours"""
         assert self.transformer._parse_time_limit("2HR") == 120
@@ -104,6 +446,60 @@ class TestParkingDataTransformer:
         assert self.transformer._parse_time_limit("30MIN") == 30
         assert self.transformer._parse_time_limit("15 MIN") == 15
 
+    def test_parse_time_limit_mixed_formats(self):
+        """Test time limit parsing for lowercase, unitless and prefixed values"""
+        assert self.transformer._parse_time_limit("2 hours") == 120
+        assert self.transformer._parse_time_limit("45") == 45
+        assert self.transformer._parse_time_limit("MAX 2HR") == 120
+        assert self.transformer._parse_time_limit("MAX 30 MIN") == 30
+        assert self.transformer._parse_time_limit("NO LIMIT") == 0
+        assert self.transformer._parse_time_limit("90 minutes") == 90
+        assert self.transformer._parse_time_limit("3 hrs") == 180
+        assert self.transformer._parse_time_limit(None) is None
+
+    def test_parse_time_limit_irregular_formats(self):
+        """Test strings outside the common forms keep the digit-scanning results"""
+        assert self.transformer._parse_time_limit("2H") == 2  # Bare "H" is not an hour marker
+        assert self.transformer._parse_time_limit("1 HR 30 MIN") == 60
+        assert self.transformer._parse_time_limit("") == 0
+
+    def test_dataclasses_use_slots(self):
+        """Test transformed records carry no per-instance __dict__"""
+        from transformers.parking_transformer import RPPZone, ParkingRegulation, ParkingMeter, MeteredZone
+
+        zone = RPPZone(area_code="A", name="Area A", polygon=[])
+        metered_zone = MeteredZone(
+            zone_id="METERED_0001", name="Metered - Test St", polygon=[],
+            meter_count=2, cap_colors=["Grey"], avg_time_limit=60, rate_area=None
+        )
+        regulation = ParkingRegulation(
+            street_name="Test St", from_street="1st", to_street="2nd",
+            side="EVEN", rpp_area="A", time_limit=60, hours_begin=None, hours_end=None
+        )
+        meter = ParkingMeter(
+            post_id="M1", latitude=37.77, longitude=-122.41,
+            street_name="Test St", street_num=None, cap_color="Grey", time_limit=60, rate_area=None
+        )
+
+        for obj in (zone, metered_zone, regulation, meter):
+            assert not hasattr(obj, "__dict__")
+
+    def test_norm_area(self):
+        """Test area codes normalize case, whitespace and type"""
+        from transformers.parking_transformer import _norm_area
+
+        assert _norm_area(" a ") == "A"
+        assert _norm_area("AA") == "AA"
+        assert _norm_area(7) == "7"
+
+    def test_parse_days(self):
+        """Test days parsing returns a shared, stripped tuple"""
+        from transformers.parking_transformer import _parse_days
+
+        assert _parse_days("MON, TUE,,WED ") == ("MON", "TUE", "WED")
+        assert _parse_days("") == ()
+        assert _parse_days("M-F") is _parse_days("M-F")
+
     def test_generate_app_data(self):
         """Test app data generation"""
         from transformers.parking_transformer import RPPZone, ParkingRegulation, ParkingMeter
@@ -125,6 +521,142 @@ class TestParkingDataTransformer:
         assert "meters" in app_data
         assert len(app_data["zones"]) == 1
         assert len(app_data["meters"]) == 1
+        assert app_data["zones"][0]["blockCount"] == 1
+        assert app_data["zones"][0]["nonPermitTimeLimit"] == 60
+        assert app_data["zones"][0]["bbox"] == [0.0, 0.0, 0.0, 0.0]  # No coordinates
+
+        zones = [RPPZone(area_code="B", name="Area B", polygon=[[(-122.5, 37.7), (-122.4, 37.8)], [(-122.6, 37.75)]])]
+        assert self.transformer.generate_app_data(zones, [], [])["zones"][0]["bbox"] == [-122.6, 37.7, -122.4, 37.8]
+
+    def test_generate_app_data_columnar_meters(self):
+        """Test meters can be emitted as parallel arrays"""
+        from transformers.parking_transformer import ParkingMeter
+
+        meters = [
+            ParkingMeter(
+                post_id=f"M{i}", latitude=37.77, longitude=-122.41,
+                street_name="Test St", street_num=None, cap_color="Grey", time_limit=60, rate_area=None
+            )
+            for i in range(3)
+        ]
+
+        app_data = self.transformer.generate_app_data([], [], meters, columnar_meters=True)
+
+        assert app_data["meters"]["ids"] == ["M0", "M1", "M2"]
+        assert app_data["meters"]["timeLimits"] == [60, 60, 60]
+        assert app_data["stats"]["totalMeters"] == 3
+
+    def test_generate_app_data_grid_index(self):
+        """Test the zone grid index lists zones for the cells they cover"""
+        zones = self.transformer.transform_rpp_areas([
+            {"attributes": {"AREA": "A"}, "geometry": {"rings": [[[0.0, 0.0], [1.5, 0.0], [1.5, 0.5], [0.0, 0.0]]]}},
+            {"attributes": {"AREA": "B"}, "geometry": {"rings": [[[1.2, 1.2], [2.0, 1.2], [2.0, 2.0], [1.2, 1.2]]]}},
+        ])
+
+        index = self.transformer.generate_app_data(zones, [], [], grid_cell_size=1.0)["zoneGridIndex"]
+
+        assert index["bbox"] == [0.0, 0.0, 2.0, 2.0]
+        assert (index["cols"], index["rows"]) == (3, 3)
+        assert index["cells"]["0"] == ["A"]
+        assert index["cells"]["1"] == ["A"]
+        assert index["cells"]["4"] == ["B"]
+        assert "3" not in index["cells"]
+        assert "zoneGridIndex" not in self.transformer.generate_app_data(zones, [], [])
+
+    def test_generate_app_data_quantized(self):
+        """Test quantized polygons decode back to the source coordinates"""
+        zones = self.transformer.transform_rpp_areas([
+            {"attributes": {"AREA": "A"}, "geometry": {"rings": [[[-122.5, 37.5], [-122.25, 37.5], [-122.25, 37.754321]]]}}
+        ])
+
+        app_data = self.transformer.generate_app_data(zones, [], [], quantize_scale=1_000_000)
+
+        zone = app_data["zones"][0]
+        scale = zone["transform"]["scale"]
+        tx, ty = zone["transform"]["translate"]
+        assert zone["polygon"][0][0] == [0, 0]
+        assert zone["polygon"][0][2] == [250000, 254321]
+        x, y = zone["polygon"][0][2]
+        assert (x / scale + tx, y / scale + ty) == pytest.approx((-122.25, 37.754321), abs=1e-6)
+
+    def test_generate_app_data_v2(self):
+        """Test polygons are emitted as float32 buffers with ring offsets"""
+        import base64
+        import struct
+
+        zones = self.transformer.transform_rpp_areas([
+            {
+                "attributes": {"AREA": "A"},
+                "geometry": {"rings": [
+                    [[-122.5, 37.5], [-122.25, 37.5], [-122.25, 37.75]],
+                    [[-122.0, 37.0], [-121.5, 37.0]],
+                ]},
+            }
+        ])
+
+        app_data = self.transformer.generate_app_data_v2(zones, [], [])
+
+        polygon = app_data["zones"][0]["polygon"]
+        assert polygon["ringOffsets"] == [0, 3, 5]
+        coords = struct.unpack("<10f", base64.b64decode(polygon["coords"]))
+        assert coords[:2] == (-122.5, 37.5)
+        assert coords[-2:] == (-121.5, 37.0)
+        assert app_data["polygonEncoding"] == "float32le-base64"
+
+    def test_meters_to_table(self):
+        """Test meters export to a dictionary-encoded Arrow table"""
+        pa = pytest.importorskip("pyarrow")
+
+        meters = self.transformer.transform_meters([
+            {"post_id": "M1", "latitude": "37.78", "longitude": "-122.40", "street_name": "Market St", "cap_color": "Grey"},
+            {"post_id": "M2", "latitude": "37.79", "longitude": "-122.41", "street_name": "Market St", "cap_color": "Grey"},
+        ])
+
+        table = self.transformer.meters_to_table(meters)
+
+        assert table.num_rows == 2
+        assert pa.types.is_dictionary(table.schema.field("street").type)
+        assert table.column("time_limit").to_pylist() == [60, 60]
+
+    def test_generate_app_data_bytes(self):
+        """Test serialized bundle matches the dict bundle"""
+        import json
+
+        raw_areas = [
+            {
+                "attributes": {"AREA": "A"},
+                "geometry": {"rings": [[[-122.4, 37.7, 0.0], [-122.4, 37.8, 0.0], [-122.3, 37.8, 0.0]]]},
+            }
+        ]
+        zones = self.transformer.transform_rpp_areas(raw_areas)
+
+        payload = json.loads(self.transformer.generate_app_data_bytes(zones, [], []))
+        expected = self.transformer.generate_app_data(zones, [], [])
+
+        assert payload["zones"] == expected["zones"]
+        assert payload["version"] == expected["version"]
+
+    def test_write_app_data(self, monkeypatch):
+        """Test the streamed bundle matches the in-memory one across meter chunks"""
+        import io
+        import json
+        from transformers import parking_transformer
+        from transformers.parking_transformer import ParkingMeter
+
+        monkeypatch.setattr(parking_transformer, "_METER_CHUNK_SIZE", 2)
+        zones = self.transformer.transform_rpp_areas([
+            {"attributes": {"AREA": "A"}, "geometry": {"rings": [[[-122.4, 37.7], [-122.4, 37.8], [-122.3, 37.8]]]}},
+        ])
+        meters = [ParkingMeter(f"M{i}", 37.7, -122.4, "Main St", None, "Grey", 60, None) for i in range(5)]
+
+        buffer = io.BytesIO()
+        self.transformer.write_app_data(buffer, zones, [], meters)
+        payload = json.loads(buffer.getvalue())
+        expected = json.loads(self.transformer.generate_app_data_bytes(zones, [], meters))
+
+        assert list(payload) == list(expected)
+        for key in ("zones", "meteredZones", "meters", "stats"):
+            assert payload[key] == expected[key]
 
 
 if __name__ == "__main__":
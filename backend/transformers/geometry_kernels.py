@@ -0,0 +1,128 @@
+"""
+Numeric geometry kernels over (N, 2) float64 coordinate arrays.
+
+Compiled with Numba when it is installed; otherwise the same functions run
+as plain Python, so callers never need to check.
+"""
+from typing import Any, List, Sequence
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True)
+def point_in_ring(x: float, y: float, ring: np.ndarray) -> bool:
+    """Crossing-number (ray casting) test of point (x, y) against a closed (N, 2) ring"""
+    inside = False
+    n = ring.shape[0]
+    j = n - 1
+    for i in range(n):
+        xi, yi = ring[i, 0], ring[i, 1]
+        xj, yj = ring[j, 0], ring[j, 1]
+        if (yi > y) != (yj > y):
+            if x < (xj - xi) * (y - yi) / (yj - yi) + xi:
+                inside = not inside
+        j = i
+    return inside
+
+
+@njit(cache=True)
+def _cross(points: np.ndarray, o: int, a: int, b: int) -> float:
+    """Z component of (a - o) x (b - o); positive for a counter-clockwise turn"""
+    return ((points[a, 0] - points[o, 0]) * (points[b, 1] - points[o, 1])
+            - (points[a, 1] - points[o, 1]) * (points[b, 0] - points[o, 0]))
+
+
+@njit(cache=True)
+def _monotone_chain_jit(points: np.ndarray) -> np.ndarray:
+    """Monotone chain over array elements (fast once compiled by Numba)"""
+    n = points.shape[0]
+    if n < 3:
+        return np.arange(n)
+    hull = np.empty(2 * n, dtype=np.int64)
+    k = 0
+    # Lower hull
+    for i in range(n):
+        while k >= 2 and _cross(points, hull[k - 2], hull[k - 1], i) <= 0:
+            k -= 1
+        hull[k] = i
+        k += 1
+    # Upper hull
+    lower_size = k + 1
+    for i in range(n - 2, -1, -1):
+        while k >= lower_size and _cross(points, hull[k - 2], hull[k - 1], i) <= 0:
+            k -= 1
+        hull[k] = i
+        k += 1
+    return hull[:k - 1]
+
+
+def _monotone_chain_py(points: np.ndarray) -> np.ndarray:
+    """Monotone chain over Python floats and lists (fast without Numba)"""
+    xs = points[:, 0].tolist()
+    ys = points[:, 1].tolist()
+    n = len(xs)
+    if n < 3:
+        return np.arange(n)
+
+    def turns_left(o: int, a: int, b: int) -> bool:
+        return (xs[a] - xs[o]) * (ys[b] - ys[o]) - (ys[a] - ys[o]) * (xs[b] - xs[o]) > 0
+
+    hull: List[int] = []
+    # Lower hull
+    for i in range(n):
+        while len(hull) >= 2 and not turns_left(hull[-2], hull[-1], i):
+            hull.pop()
+        hull.append(i)
+    # Upper hull
+    lower_size = len(hull) + 1
+    for i in range(n - 2, -1, -1):
+        while len(hull) >= lower_size and not turns_left(hull[-2], hull[-1], i):
+            hull.pop()
+        hull.append(i)
+    return np.array(hull[:-1], dtype=np.int64)
+
+
+def monotone_chain(points: np.ndarray) -> np.ndarray:
+    """
+    Andrew's monotone chain convex hull of (N, 2) points, which must be
+    unique and sorted by (x, y) (as np.unique(..., axis=0) returns them).
+    Returns hull vertex indices in counter-clockwise order, first not repeated.
+    """
+    if NUMBA_AVAILABLE:
+        return _monotone_chain_jit(points)
+    return _monotone_chain_py(points)
+
+
+def point_in_polygon(x: float, y: float, polygon: List[Any], bbox: Sequence[float], holes: bool = True) -> bool:
+    """
+    Test whether (lon, lat) falls inside a zone polygon.
+
+    With holes=True (ArcGIS RPP areas, whose inner rings are holes) rings
+    combine by even-odd parity, so a point inside a hole is outside. Zones
+    derived from blockfaces hold separate, possibly overlapping block-face
+    polygons instead; pass holes=False to count a hit on any ring.
+    The zone's bbox (min_lon, min_lat, max_lon, max_lat) rejects far-away
+    points before any ring is scanned.
+    """
+    min_x, min_y, max_x, max_y = bbox
+    if x < min_x or x > max_x or y < min_y or y > max_y:
+        return False
+    inside = False
+    for ring in polygon:
+        if point_in_ring(x, y, np.asarray(ring, dtype=np.float64)):
+            if not holes:
+                return True
+            inside = not inside
+    return inside
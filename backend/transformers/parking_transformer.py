@@ -1,39 +1,184 @@
 """Transform raw parking data into app-ready format"""
+import base64
+import hashlib
+import json
 import logging
+import math
+import os
+import pickle
+import re
+import sys
+from array import array
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, BinaryIO, Dict, Iterable, List, Optional, Tuple, Union
 from datetime import datetime
+from functools import lru_cache
+from itertools import chain
 
 try:
-    from shapely.geometry import LineString, MultiLineString, Polygon, MultiPolygon, mapping, box
+    import shapely
+    from shapely.geometry import MultiLineString, Polygon, MultiPolygon, mapping
     from shapely.ops import unary_union
     from shapely.validation import make_valid
     SHAPELY_AVAILABLE = True
 except ImportError:
     SHAPELY_AVAILABLE = False
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+try:
+    from .geometry_kernels import NUMBA_AVAILABLE, monotone_chain
+    KERNELS_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    KERNELS_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 try:
     from scipy.spatial import ConvexHull
     SCIPY_AVAILABLE = True
 except ImportError:
     SCIPY_AVAILABLE = False
 
-logger = logging.getLogger(__name__)
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+# Common time limit strings such as "2HR", "15 MIN", "45" or "MAX 2 hours"
+# (anything else goes through the general digit-scanning fallback)
+_TIME_LIMIT_RE = re.compile(r"\s*(?:MAX\s*)?(\d+)\s*(HOURS?|HRS?|MINUTES?|MINS?)?\s*", re.IGNORECASE)
+
+# Meter time limit (minutes) implied by cap color
+_COLOR_LIMITS = {
+    "GREEN": 15,     # Short-term
+    "YELLOW": 30,    # Commercial loading
+    "GREY": 60,      # Standard 1hr
+    "GRAY": 60,
+    "BROWN": 120,    # Tour bus
+}
+# Also keyed by the lower and title case spellings the meter feed uses ("Grey"),
+# so the common cases need no upper() call
+_COLOR_LIMITS.update({
+    variant: minutes
+    for color, minutes in list(_COLOR_LIMITS.items())
+    for variant in (color.lower(), color.title())
+})
+
+# Candidate attribute names, in priority order, for ArcGIS RPP area features
+_AREA_KEYS = ("AREA", "area", "RPP_AREA")
+_NBHD_KEYS = ("NEIGHBORHOOD", "neighborhood", "NHOOD", "nhood")
+
+# Blockface fields holding each of a block face's (up to three) RPP areas, and its geometry
+_RPP_AREA_FIELDS = ("rpparea1", "rpparea2", "rpparea3", "RPPAREA1", "RPPAREA2", "RPPAREA3")
+_GEOM_KEYS = ("shape", "the_geom", "geometry")  # hi6h-neyh uses 'shape'
+
+# Lines per worker thread when buffering block faces (GEOS releases the GIL)
+_BUFFER_CHUNK_SIZE = 5000
+
+# Point count above which scipy's Qhull beats the interpreted (non-Numba) hull kernel
+_QHULL_MIN_POINTS = 50
+
+# Meters serialized per chunk by write_app_data (bounds the transient row dicts)
+_METER_CHUNK_SIZE = 5000
+
+# Bump when metered-zone derivation changes, so stale on-disk caches are ignored
+_METERED_ZONE_CACHE_VERSION = 4
+
+# Bounding box of a zone without coordinates (also the "not computed" default)
+_EMPTY_BBOX = (0.0, 0.0, 0.0, 0.0)
+
+
+if PYARROW_AVAILABLE:
+    # Columnar export schemas; repeated strings are dictionary-encoded
+    _STRING_DICT = pa.dictionary(pa.int32(), pa.string())
+    METER_SCHEMA = pa.schema([
+        ("post_id", pa.string()),
+        ("lat", pa.float64()),
+        ("lon", pa.float64()),
+        ("street", _STRING_DICT),
+        ("cap_color", _STRING_DICT),
+        ("time_limit", pa.int16()),
+        ("rate_area", _STRING_DICT),
+    ])
+    REGULATION_SCHEMA = pa.schema([
+        ("street", _STRING_DICT),
+        ("from_street", _STRING_DICT),
+        ("to_street", _STRING_DICT),
+        ("side", _STRING_DICT),
+        ("rpp_area", _STRING_DICT),
+        ("time_limit", pa.int16()),
+        ("hours_begin", pa.string()),
+        ("hours_end", pa.string()),
+        ("days", pa.list_(pa.string())),
+    ])
+
+
+def _intern(value: Any) -> Any:
+    """Intern strings so heavily repeated names (streets, sides, areas) share one object"""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+@lru_cache(maxsize=4096)
+def _norm_area(area: Any) -> str:
+    """Normalize an RPP area code (" a" -> "A"); cached, as there are few distinct codes"""
+    return sys.intern(str(area).upper().strip())
+
+
+@lru_cache(maxsize=256)
+def _parse_days(days_str: str) -> Tuple[str, ...]:
+    """Parse a days string ("MON,TUE,...") into a tuple; cached, as the data has few distinct values"""
+    if not days_str:
+        return ()
+    return tuple(sys.intern(d) for d in map(str.strip, days_str.split(",")) if d)
+
+
+def _first(record: Dict[str, Any], keys: Tuple[str, ...]) -> Any:
+    """Return the first truthy value among the candidate keys, or None"""
+    for key in keys:
+        value = record.get(key)
+        if value:
+            return value
+    return None
+
+
+def _resolve_key(record: Dict[str, Any], keys: Tuple[str, ...]) -> Optional[str]:
+    """Return the first candidate key with a truthy value in a sample record, or None"""
+    for key in keys:
+        if record.get(key):
+            return key
+    return None
+
+
+@dataclass(slots=True)
 class RPPZone:
     """Represents a transformed RPP zone"""
     area_code: str
     name: str
-    polygon: List[List[Tuple[float, float]]]  # List of rings, each ring is list of (lon, lat)
+    polygon: List[Any]  # List of rings, each an (N, 2) array or list of (lon, lat) tuples
     neighborhoods: List[str] = field(default_factory=list)
     total_blocks: int = 0
     # Track which polygons are multi-permit (index -> list of all valid permit areas)
     multi_permit_polygons: Dict[int, List[str]] = field(default_factory=dict)
+    bbox: Tuple[float, float, float, float] = _EMPTY_BBOX  # (min_lon, min_lat, max_lon, max_lat)
 
 
-@dataclass
+@dataclass(slots=True)
 class ParkingRegulation:
     """Represents a parking regulation on a street segment"""
     street_name: str
@@ -44,11 +189,11 @@ class ParkingRegulation:
     time_limit: Optional[int]  # minutes
     hours_begin: Optional[str]
     hours_end: Optional[str]
-    days: List[str] = field(default_factory=list)
+    days: Tuple[str, ...] = ()
     geometry: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ParkingMeter:
     """Represents a parking meter"""
     post_id: str
@@ -61,12 +206,12 @@ class ParkingMeter:
     rate_area: Optional[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class MeteredZone:
     """Represents a paid/metered parking zone derived from meter locations"""
     zone_id: str
     name: str
-    polygon: List[List[Tuple[float, float]]]  # List of polygon boundaries
+    polygon: List[Any]  # List of rings, each an (N, 2) array or list of (lon, lat) tuples
     meter_count: int
     cap_colors: List[str]  # Unique cap colors in zone
     avg_time_limit: Optional[int]  # Average time limit in minutes
@@ -87,53 +232,70 @@ class ParkingDataTransformer:
             "errors": 0
         }
 
-    def transform_rpp_areas(self, raw_areas: List[Dict[str, Any]]) -> List[RPPZone]:
+    def transform_rpp_areas(self, raw_areas: Iterable[Dict[str, Any]]) -> List[RPPZone]:
         """
         Transform SFMTA ArcGIS RPP area features into RPPZone objects.
+
+        Accepts any iterable of features (e.g. a generator over a GeoJSONSeq
+        file), consuming each one once so the raw input never has to be
+        held in memory as a whole.
         """
-        logger.info(f"Transforming {len(raw_areas)} RPP areas")
+        logger.info("Transforming RPP areas")
         zones = []
+        feature_count = 0
+        errors = 0
+
+        # Features in a batch share a schema, so pick the area code key from
+        # the first one; records that don't have it fall back to a full scan
+        features = iter(raw_areas)
+        first = next(features, None)
+        area_key = None
+        if first is not None:
+            area_key = _resolve_key(first.get("attributes") or {}, _AREA_KEYS)
+            features = chain((first,), features)
+
+        for feature in features:
+            feature_count += 1
+            attrs = feature.get("attributes") or {}
+            geometry = feature.get("geometry") or {}
+
+            # Extract area code
+            area_code = attrs.get(area_key) if area_key else None
+            if not area_code:
+                area_code = _first(attrs, _AREA_KEYS)
+            if not area_code:
+                logger.warning("Skipping feature without area code: %s", attrs)
+                continue
 
-        for feature in raw_areas:
-            try:
-                attrs = feature.get("attributes", {})
-                geometry = feature.get("geometry", {})
-
-                # Extract area code
-                area_code = attrs.get("AREA") or attrs.get("area") or attrs.get("RPP_AREA")
-                if not area_code:
-                    logger.warning(f"Skipping feature without area code: {attrs}")
-                    continue
-
-                # Extract polygon rings
-                rings = geometry.get("rings", [])
-                if not rings:
-                    logger.warning(f"Skipping area {area_code} without geometry")
-                    continue
-
-                # Convert rings to (lon, lat) tuples
-                polygon = []
-                for ring in rings:
-                    polygon.append([(coord[0], coord[1]) for coord in ring])
-
-                zone = RPPZone(
-                    area_code=str(area_code).upper(),
-                    name=attrs.get("NAME", f"Area {area_code}"),
-                    polygon=polygon,
-                    neighborhoods=self._extract_neighborhoods(attrs),
-                )
+            # Extract polygon rings
+            rings = geometry.get("rings")
+            if not rings:
+                logger.warning("Skipping area %s without geometry", area_code)
+                continue
 
-                zones.append(zone)
+            # Convert rings to (N, 2) coordinate arrays (malformed coordinates are the only risky step)
+            try:
+                polygon = [self._ring_to_array(ring) for ring in rings]
+                bbox = self._polygon_bbox(polygon)
+            except (TypeError, IndexError, ValueError) as e:
+                logger.error("Error transforming RPP area %s: %s", area_code, e)
+                errors += 1
+                continue
 
-            except Exception as e:
-                logger.error(f"Error transforming RPP area: {e}")
-                self.stats["errors"] += 1
+            zones.append(RPPZone(
+                area_code=_norm_area(area_code),
+                name=attrs.get("NAME", f"Area {area_code}"),
+                polygon=polygon,
+                neighborhoods=self._extract_neighborhoods(attrs),
+                bbox=bbox,
+            ))
 
         self.stats["rpp_zones"] = len(zones)
-        logger.info(f"Transformed {len(zones)} RPP zones")
+        self.stats["errors"] += errors
+        logger.info(f"Transformed {len(zones)} RPP zones from {feature_count} features ({errors} errors)")
         return zones
 
-    def derive_zones_from_blockface(self, raw_blockfaces: List[Dict[str, Any]]) -> List[RPPZone]:
+    def derive_zones_from_blockface(self, raw_blockfaces: Iterable[Dict[str, Any]]) -> List[RPPZone]:
         """
         Derive RPP zones from blockface data by buffering street segments into polygons.
 
@@ -142,8 +304,10 @@ class ParkingDataTransformer:
         - Handles overlapping zones via rpparea1, rpparea2, rpparea3
         - Keeps each block face as separate polygon (no convex hull)
         - Tracks multi-permit polygons for special map rendering
+
+        raw_blockfaces may be any iterable (e.g. a generator); it is consumed once.
         """
-        logger.info(f"Deriving zones from {len(raw_blockfaces)} blockface records")
+        logger.info("Deriving zones from blockface records")
 
         if not SHAPELY_AVAILABLE:
             logger.warning("Shapely not available - falling back to convex hull method")
@@ -155,20 +319,28 @@ class ParkingDataTransformer:
 
         # Store polygon data with multi-permit tracking
         # areas_polygons: Dict[area_code -> List of (polygon, all_valid_areas)]
-        areas_polygons: Dict[str, List[Tuple[List[Tuple[float, float]], List[str]]]] = {}
+        areas_polygons: Dict[str, List[Tuple[List[Tuple[float, float]], List[str]]]] = defaultdict(list)
 
         processed = 0
         skipped_no_geom = 0
         skipped_no_area = 0
+        skipped_duplicate = 0
         multi_permit_count = 0
 
+        # Pass 1: collect each block face's areas and geometry. Blockface rows repeat
+        # per regulation, so one street segment can appear several times (possibly
+        # with different areas) - key each distinct geometry by its repr, so it is
+        # buffered once and tagged with the union of every area it was seen under
+        areas_by_geom: Dict[str, List[str]] = {}
+        geoms_by_key: Dict[str, Any] = {}
+
         for record in raw_blockfaces:
             # Get ALL RPP areas for this block face (supports overlapping zones)
             rpp_areas = []
-            for field in ["rpparea1", "rpparea2", "rpparea3", "RPPAREA1", "RPPAREA2", "RPPAREA3"]:
+            for field in _RPP_AREA_FIELDS:
                 area = record.get(field)
                 if area:
-                    area_code = str(area).upper().strip()
+                    area_code = _norm_area(area)
                     if area_code and area_code not in rpp_areas:
                         rpp_areas.append(area_code)
 
@@ -176,18 +348,35 @@ class ParkingDataTransformer:
                 skipped_no_area += 1
                 continue
 
-            # Extract geometry and buffer into polygon
-            geom = record.get("shape") or record.get("the_geom") or record.get("geometry")
+            geom = _first(record, _GEOM_KEYS)
             if not geom:
                 skipped_no_geom += 1
                 continue
 
-            # Convert geometry to Shapely LineString and buffer
-            buffered_polygon = self._buffer_geometry_to_polygon(geom, BUFFER_DISTANCE)
-            if not buffered_polygon:
+            geom_key = repr(geom)
+            geom_areas = areas_by_geom.get(geom_key)
+            if geom_areas is None:
+                geoms_by_key[geom_key] = geom
+                areas_by_geom[geom_key] = rpp_areas
+                continue
+
+            skipped_duplicate += 1
+            for area_code in rpp_areas:
+                if area_code not in geom_areas:
+                    geom_areas.append(area_code)
+
+        # Buffer all distinct geometries into polygons in one vectorized call
+        geom_keys = list(geoms_by_key)
+        buffered = self._buffer_geometries([geoms_by_key[key] for key in geom_keys], BUFFER_DISTANCE)
+
+        # Pass 2: assign each buffered block face to all of its areas
+        for geom_key, buffered_polygon in zip(geom_keys, buffered):
+            if buffered_polygon is None:
                 skipped_no_geom += 1
                 continue
 
+            rpp_areas = areas_by_geom[geom_key]
+
             # Track if this is a multi-permit blockface
             is_multi_permit = len(rpp_areas) > 1
             if is_multi_permit:
@@ -195,14 +384,16 @@ class ParkingDataTransformer:
 
             # Add this polygon to ALL its RPP areas (handles overlapping zones)
             # Store tuple of (polygon, all_valid_areas) for multi-permit tracking
+            all_areas = sorted(rpp_areas)
             for area_code in rpp_areas:
-                if area_code not in areas_polygons:
-                    areas_polygons[area_code] = []
-                areas_polygons[area_code].append((buffered_polygon, sorted(rpp_areas)))
+                areas_polygons[area_code].append((buffered_polygon, all_areas))
 
             processed += 1
 
-        logger.info(f"Processed {processed} blockfaces, skipped {skipped_no_area} (no RPP area), {skipped_no_geom} (no geometry)")
+        logger.info(
+            f"Processed {processed} blockfaces, skipped {skipped_no_area} (no RPP area), "
+            f"{skipped_no_geom} (no geometry), {skipped_duplicate} (duplicate geometry)"
+        )
         logger.info(f"Found {multi_permit_count} multi-permit blockfaces")
 
         # Create zones from collected polygons
@@ -225,7 +416,8 @@ class ParkingDataTransformer:
                 name=f"Zone {area_code}",
                 polygon=polygons,
                 total_blocks=len(polygons),
-                multi_permit_polygons=multi_permit_polygons
+                multi_permit_polygons=multi_permit_polygons,
+                bbox=self._polygon_bbox(polygons),
             )
             zones.append(zone)
             mp_count = len(multi_permit_polygons)
@@ -275,7 +467,7 @@ class ParkingDataTransformer:
 
             # Group polygons by their multi-permit signature
             # Polygons with same valid permit areas can be merged
-            groups: Dict[Tuple[str, ...], List[Tuple[int, List[Tuple[float, float]]]]] = {}
+            groups: Dict[Tuple[str, ...], List[Tuple[int, List[Tuple[float, float]]]]] = defaultdict(list)
 
             for idx, poly_coords in enumerate(zone.polygon):
                 # Get the permit signature for this polygon
@@ -284,17 +476,14 @@ class ParkingDataTransformer:
                 else:
                     sig = (zone.area_code,)
 
-                if sig not in groups:
-                    groups[sig] = []
                 groups[sig].append((idx, poly_coords))
 
-            # Merge each group
+            # Merge all groups together (one batch of GEOS calls per zone)
             new_polygons = []
             new_multi_permit = {}
 
-            for sig, poly_list in groups.items():
-                merged = self._merge_polygon_group([p[1] for p in poly_list])
-
+            merged_groups = self._merge_polygon_groups([[p[1] for p in poly_list] for poly_list in groups.values()])
+            for sig, merged in zip(groups, merged_groups):
                 for merged_poly in merged:
                     new_idx = len(new_polygons)
                     new_polygons.append(merged_poly)
@@ -311,63 +500,65 @@ class ParkingDataTransformer:
                 polygon=new_polygons,
                 neighborhoods=zone.neighborhoods,
                 total_blocks=zone.total_blocks,
-                multi_permit_polygons=new_multi_permit
+                multi_permit_polygons=new_multi_permit,
+                bbox=self._polygon_bbox(new_polygons),
             )
             merged_zones.append(merged_zone)
 
         logger.info(f"Merged polygons: {total_before} -> {total_after} ({total_before - total_after} reduced)")
         return merged_zones
 
-    def _merge_polygon_group(self, polygons: List[List[Tuple[float, float]]]) -> List[List[Tuple[float, float]]]:
+    def _merge_polygon_groups(self, groups: List[List[Any]]) -> List[List[Any]]:
         """
-        Merge a list of polygon coordinate lists into fewer polygons using union.
-        Returns list of merged polygon coordinates.
+        Merge each group of polygon coordinate lists into fewer polygons using union.
+        Polygons of all groups are built and repaired in one vectorized pass; only
+        the union itself runs per group, so groups never merge into each other.
+        Returns the merged polygon coordinates for each group (a group that cannot
+        be merged is returned unchanged).
         """
-        if not polygons:
-            return []
+        results = [list(polygons) for polygons in groups]
+        if not any(groups):
+            return results
 
         try:
-            # Convert to Shapely polygons
-            shapely_polys = []
-            for coords in polygons:
-                if len(coords) < 4:  # Need at least 3 points + closing
-                    continue
-                try:
-                    poly = Polygon(coords)
-                    if not poly.is_valid:
-                        poly = make_valid(poly)
-                    if poly.is_valid and not poly.is_empty:
-                        # Handle case where make_valid returns GeometryCollection
-                        if isinstance(poly, (Polygon, MultiPolygon)):
-                            shapely_polys.append(poly)
-                        elif hasattr(poly, 'geoms'):
-                            for geom in poly.geoms:
-                                if isinstance(geom, Polygon) and not geom.is_empty:
-                                    shapely_polys.append(geom)
-                except Exception:
-                    continue
-
-            if not shapely_polys:
-                return polygons  # Return original if conversion failed
-
-            # Union all polygons
-            merged = unary_union(shapely_polys)
-
-            # Extract result coordinates
-            result = []
-            if isinstance(merged, Polygon):
-                if not merged.is_empty:
-                    result.append(list(merged.exterior.coords))
-            elif isinstance(merged, MultiPolygon):
-                for poly in merged.geoms:
-                    if not poly.is_empty:
-                        result.append(list(poly.exterior.coords))
-
-            return result if result else polygons
+            # Build all polygons in one vectorized call (shapely 2 / GEOS)
+            rings = []
+            ring_groups = []
+            for group_id, polygons in enumerate(groups):
+                for coords in polygons:
+                    if len(coords) >= 4:  # 3 points + closing
+                        rings.append(np.asarray(coords, dtype=np.float64)[:, :2])
+                        ring_groups.append(group_id)
+            if not rings:
+                return results  # Return originals if conversion failed
+            ring_ids = np.repeat(np.arange(len(rings)), [len(ring) for ring in rings])
+            geoms = shapely.polygons(shapely.linearrings(np.concatenate(rings), indices=ring_ids))
+
+            # Repair invalid polygons, keeping only polygonal parts (make_valid may return collections)
+            invalid = ~shapely.is_valid(geoms)
+            if invalid.any():
+                geoms[invalid] = shapely.make_valid(geoms[invalid])
+            parts, part_ids = shapely.get_parts(geoms, return_index=True)
+            keep = np.isin(shapely.get_type_id(parts), (3, 6)) & ~shapely.is_empty(parts)  # Polygon, MultiPolygon
+            parts = parts[keep]
+            part_groups = np.asarray(ring_groups)[part_ids[keep]]
+
+            # Union each group and extract the exterior of each resulting polygon
+            for group_id in np.unique(part_groups).tolist():
+                merged = shapely.get_parts(shapely.union_all(parts[part_groups == group_id]))
+                result = [
+                    self._ring_to_array(poly.exterior.coords)
+                    for poly in merged
+                    if isinstance(poly, Polygon) and not poly.is_empty
+                ]
+                if result:
+                    results[group_id] = result
+
+            return results
 
         except Exception as e:
             logger.debug(f"Polygon merge failed: {e}")
-            return polygons
+            return results
 
     def _split_different_zone_overlaps(self, zones: List[RPPZone]) -> List[RPPZone]:
         """
@@ -417,18 +608,34 @@ class ParkingDataTransformer:
         # (zone_idx, poly_idx, shapely_poly, area_code, multi_permit_sig)
         all_polys: List[Tuple[int, int, Polygon, str, Tuple[str, ...]]] = []
 
+        keys: List[Tuple[int, int]] = []
+        rings = []
         for zone_idx, zone in enumerate(zones):
             for poly_idx, coords in enumerate(zone.polygon):
                 if len(coords) < 4:
                     continue
                 try:
-                    poly = Polygon(coords)
-                    poly = fix_polygon(poly)
-                    if poly is not None:
-                        sig = get_multi_permit_sig(zone, poly_idx)
-                        all_polys.append((zone_idx, poly_idx, poly, zone.area_code, sig))
-                except Exception:
+                    rings.append(np.asarray(coords, dtype=np.float64)[:, :2])
+                except (TypeError, ValueError, IndexError):
                     continue
+                keys.append((zone_idx, poly_idx))
+
+        # Build every polygon and check validity in one vectorized call each;
+        # only the (rare) invalid polygons need per-polygon repair
+        if rings:
+            ring_ids = np.repeat(np.arange(len(rings)), [len(ring) for ring in rings])
+            geoms = shapely.polygons(shapely.linearrings(np.concatenate(rings), indices=ring_ids))
+            valid = shapely.is_valid(geoms).tolist()
+        else:
+            geoms, valid = [], []
+
+        for (zone_idx, poly_idx), poly, is_valid in zip(keys, geoms, valid):
+            if not is_valid:
+                poly = fix_polygon(poly)
+                if poly is None:
+                    continue
+            zone = zones[zone_idx]
+            all_polys.append((zone_idx, poly_idx, poly, zone.area_code, get_multi_permit_sig(zone, poly_idx)))
 
         logger.info(f"Built index with {len(all_polys)} valid polygons")
 
@@ -438,12 +645,17 @@ class ParkingDataTransformer:
         skipped_multi_permit = 0
         error_count = 0
 
-        # Check each pair of polygons from different zones
+        # Only polygons that intersect can need splitting, and splitting only shrinks
+        # them, so an STRtree over the starting polygons yields every pair to check
+        tree = shapely.STRtree([p[2] for p in all_polys])
+        poly_areas = np.array([p[3] for p in all_polys], dtype=object)
+
+        # Check each intersecting pair of polygons from different zones (in index order)
         for i, (z_idx1, p_idx1, poly1, area1, sig1) in enumerate(all_polys):
-            for j, (z_idx2, p_idx2, poly2, area2, sig2) in enumerate(all_polys[i+1:], start=i+1):
-                # Skip same zone
-                if area1 == area2:
-                    continue
+            candidates = np.sort(tree.query(poly1, predicate="intersects"))
+            candidates = candidates[(candidates > i) & (poly_areas[candidates] != area1)]  # Skip same zone
+            for j in candidates.tolist():
+                z_idx2, p_idx2, poly2, area2, sig2 = all_polys[j]
 
                 # CRITICAL: Skip if polygons share multi-permit signature
                 # This means they're the same physical block (multi-permit area)
@@ -460,16 +672,11 @@ class ParkingDataTransformer:
                     continue
 
                 try:
-                    # Get current versions (may be modified)
+                    # Get current versions (may be modified). Both are already valid:
+                    # polygons are fixed when indexed and again before being stored
                     current1 = modified.get((z_idx1, p_idx1), poly1)
                     current2 = modified.get((z_idx2, p_idx2), poly2)
 
-                    # Fix geometries if needed
-                    current1 = fix_polygon(current1)
-                    current2 = fix_polygon(current2)
-                    if current1 is None or current2 is None:
-                        continue
-
                     # Check for overlap
                     if not current1.intersects(current2):
                         continue
@@ -494,13 +701,13 @@ class ParkingDataTransformer:
                     if width > height:
                         # Vertical split
                         split_x = centroid.x
-                        left_box = box(minx - 0.01, miny - 0.01, split_x, maxy + 0.01)
-                        right_box = box(split_x, miny - 0.01, maxx + 0.01, maxy + 0.01)
+                        left_box = (minx - 0.01, miny - 0.01, split_x, maxy + 0.01)
+                        right_box = (split_x, miny - 0.01, maxx + 0.01, maxy + 0.01)
                     else:
                         # Horizontal split
                         split_y = centroid.y
-                        left_box = box(minx - 0.01, miny - 0.01, maxx + 0.01, split_y)
-                        right_box = box(minx - 0.01, split_y, maxx + 0.01, maxy + 0.01)
+                        left_box = (minx - 0.01, miny - 0.01, maxx + 0.01, split_y)
+                        right_box = (minx - 0.01, split_y, maxx + 0.01, maxy + 0.01)
 
                     # Assign halves: zone with lower code gets "left/bottom", other gets "right/top"
                     if area1 < area2:
@@ -510,9 +717,11 @@ class ParkingDataTransformer:
                         zone1_gets = right_box
                         zone2_gets = left_box
 
-                    # Subtract the other zone's half from each polygon
-                    new_poly1 = current1.difference(intersection.intersection(zone2_gets))
-                    new_poly2 = current2.difference(intersection.intersection(zone1_gets))
+                    # Subtract the other zone's half from each polygon. A full overlay
+                    # intersection is used on purpose: clip_by_rect is faster but may
+                    # return invalid rings, which make the difference() below raise
+                    new_poly1 = current1.difference(intersection.intersection(shapely.box(*zone2_gets)))
+                    new_poly2 = current2.difference(intersection.intersection(shapely.box(*zone1_gets)))
 
                     # Fix and validate results
                     new_poly1 = fix_polygon(new_poly1) if isinstance(new_poly1, Polygon) else None
@@ -527,7 +736,7 @@ class ParkingDataTransformer:
                 except Exception as e:
                     error_count += 1
                     if error_count <= 5:
-                        logger.debug(f"Failed to process overlap between {area1} and {area2}: {e}")
+                        logger.debug("Failed to process overlap between %s and %s: %s", area1, area2, e)
                     continue
 
         logger.info(f"Processed {overlap_count} cross-zone overlaps ({skipped_multi_permit} multi-permit skipped, {error_count} errors)")
@@ -536,8 +745,14 @@ class ParkingDataTransformer:
         if not modified:
             return zones
 
+        # Only zones with a modified polygon are rebuilt; the rest pass through as-is
+        touched_zones = {zone_idx for zone_idx, _ in modified}
         result_zones = []
         for zone_idx, zone in enumerate(zones):
+            if zone_idx not in touched_zones:
+                result_zones.append(zone)
+                continue
+
             new_polygons = []
             new_multi_permit = {}
 
@@ -547,7 +762,7 @@ class ParkingDataTransformer:
                     # Use modified polygon
                     mod_poly = modified[key]
                     if isinstance(mod_poly, Polygon) and not mod_poly.is_empty:
-                        new_coords = list(mod_poly.exterior.coords)
+                        new_coords = self._ring_to_array(mod_poly.exterior.coords)
                         new_idx = len(new_polygons)
                         new_polygons.append(new_coords)
 
@@ -567,97 +782,119 @@ class ParkingDataTransformer:
                 polygon=new_polygons,
                 neighborhoods=zone.neighborhoods,
                 total_blocks=zone.total_blocks,
-                multi_permit_polygons=new_multi_permit
+                multi_permit_polygons=new_multi_permit,
+                bbox=self._polygon_bbox(new_polygons),
             ))
 
         return result_zones
 
-    def _buffer_geometry_to_polygon(self, geom: Any, buffer_distance: float) -> Optional[List[Tuple[float, float]]]:
+    def _buffer_geometries(self, geoms: List[Any], buffer_distance: float) -> List[Optional[Any]]:
         """
-        Convert a geometry (LineString/MultiLineString) to a buffered polygon.
-        Returns list of (lon, lat) tuples forming the polygon exterior ring.
+        Buffer line geometries (LineString/MultiLineString) into polygons, all in
+        one vectorized Shapely call. Returns each polygon's exterior ring as an
+        (N, 2) array of (lon, lat), or None where a geometry has fewer than two
+        coordinates or buffers to nothing.
         """
-        try:
-            coords = []
-
-            if isinstance(geom, dict):
-                geom_type = geom.get("type", "")
-                raw_coords = geom.get("coordinates", [])
-
-                if geom_type == "LineString":
-                    coords = [(c[0], c[1]) for c in raw_coords]
-                elif geom_type == "MultiLineString":
-                    # Flatten all line segments
-                    for line in raw_coords:
-                        coords.extend([(c[0], c[1]) for c in line])
-                elif geom_type == "Point":
-                    # Single point - create small buffer around it
-                    coords = [(raw_coords[0], raw_coords[1])]
-                else:
-                    # Try to extract coords recursively
-                    self._flatten_coords(raw_coords, coords)
-            elif isinstance(geom, str):
-                # WKT format - skip for now
-                return None
-
-            if len(coords) < 2:
-                return None
+        results: List[Optional[Any]] = [None] * len(geoms)
+        lines = []
+        positions = []
+        for pos, geom in enumerate(geoms):
+            coords = self._line_coords(geom)
+            if coords is not None and len(coords) >= 2:
+                lines.append(coords)
+                positions.append(pos)
+        if not lines:
+            return results
 
-            # Create Shapely geometry and buffer
-            if len(coords) == 1:
-                from shapely.geometry import Point
-                line = Point(coords[0])
+        try:
+            line_ids = np.repeat(np.arange(len(lines)), [len(coords) for coords in lines])
+            line_geoms = shapely.linestrings(np.concatenate(lines), indices=line_ids)
+
+            def buffer_chunk(chunk):
+                return shapely.buffer(chunk, buffer_distance, cap_style="flat", join_style="mitre")
+
+            # Large batches are split across threads: shapely's vectorized calls run
+            # in GEOS without the GIL, so the chunks buffer in parallel
+            workers = min(os.cpu_count() or 1, len(line_geoms) // _BUFFER_CHUNK_SIZE)
+            if workers > 1:
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    buffered = np.concatenate(list(executor.map(buffer_chunk, np.array_split(line_geoms, workers))))
             else:
-                line = LineString(coords)
+                buffered = buffer_chunk(line_geoms)
 
-            # Buffer the line to create a polygon
-            buffered = line.buffer(buffer_distance, cap_style=2, join_style=2)  # flat cap, mitre join
+            # Keep the largest part of any buffer that came out as a MultiPolygon
+            for k in np.flatnonzero(shapely.get_type_id(buffered) == 6).tolist():
+                buffered[k] = max(buffered[k].geoms, key=lambda p: p.area)
 
-            if buffered.is_empty:
-                return None
+            # Extract every exterior ring with one bulk coordinate copy
+            exteriors = shapely.get_exterior_ring(buffered)
+            counts = shapely.get_num_coordinates(exteriors)
+            rings = np.split(shapely.get_coordinates(exteriors), np.cumsum(counts)[:-1])
+        except Exception as e:
+            logger.warning(f"Failed to buffer geometries: {e}")
+            return results
+
+        for pos, ring in zip(positions, rings):
+            if len(ring):
+                results[pos] = ring
+        return results
 
-            # Extract exterior coordinates
-            if hasattr(buffered, 'exterior'):
-                exterior_coords = list(buffered.exterior.coords)
-                return [(c[0], c[1]) for c in exterior_coords]
-            elif hasattr(buffered, 'geoms'):
-                # MultiPolygon - take largest
-                largest = max(buffered.geoms, key=lambda p: p.area)
-                return [(c[0], c[1]) for c in largest.exterior.coords]
+    def _line_coords(self, geom: Any) -> Optional[Any]:
+        """(lon, lat) coordinates of a GeoJSON line geometry as one (N, 2) array (MultiLineString parts chained)"""
+        if not isinstance(geom, dict):
+            return None  # WKT strings etc. are not supported
+        geom_type = geom.get("type", "")
+        raw_coords = geom.get("coordinates", [])
 
+        try:
+            if geom_type == "LineString":
+                coords = self._ring_to_array(raw_coords)
+            elif geom_type == "MultiLineString":
+                coords = [self._ring_to_array(line) for line in raw_coords if len(line)]
+                coords = np.concatenate(coords) if coords else None
+            elif geom_type == "Point":
+                return None  # A single point has no line to buffer
+            else:
+                # Try to extract coords recursively
+                flat: List[Tuple[float, float]] = []
+                self._flatten_coords(raw_coords, flat)
+                coords = np.asarray(flat, dtype=np.float64).reshape(-1, 2)
+        except (TypeError, IndexError, ValueError) as e:
+            logger.debug("Failed to read geometry coordinates: %s", e)
             return None
 
-        except Exception as e:
-            logger.debug(f"Failed to buffer geometry: {e}")
+        if coords is None or not isinstance(coords, np.ndarray) or coords.ndim != 2:
             return None
+        return coords
 
-    def _derive_zones_convex_hull(self, raw_blockfaces: List[Dict[str, Any]]) -> List[RPPZone]:
+    def _derive_zones_convex_hull(self, raw_blockfaces: Iterable[Dict[str, Any]]) -> List[RPPZone]:
         """
         Fallback: Derive zones using convex hull when Shapely is unavailable.
         """
         logger.info("Using convex hull fallback method")
 
-        # Group by RPP area (check all three fields)
-        areas: Dict[str, List[Tuple[float, float]]] = {}
+        # Group by RPP area (check all three fields), counting block faces per area
+        areas: Dict[str, List[Tuple[float, float]]] = defaultdict(list)
+        area_counts: Counter = Counter()
 
         for record in raw_blockfaces:
             # Get ALL RPP areas for this block face
-            for field in ["rpparea1", "rpparea2", "rpparea3", "RPPAREA1", "RPPAREA2", "RPPAREA3"]:
+            record_areas = set()
+            for field in _RPP_AREA_FIELDS:
                 rpp_area = record.get(field)
-                if not rpp_area:
-                    continue
-
-                area_code = str(rpp_area).upper().strip()
-                if not area_code:
-                    continue
-
-                if area_code not in areas:
-                    areas[area_code] = []
+                if rpp_area:
+                    area_code = _norm_area(rpp_area)
+                    if area_code:
+                        record_areas.add(area_code)
+            if not record_areas:
+                continue
 
-                geom = record.get("shape") or record.get("the_geom") or record.get("geometry")
-                if geom:
-                    coords = self._extract_coords_from_geom(geom)
-                    areas[area_code].extend(coords)
+            # Extract the geometry once, however many areas share it
+            geom = _first(record, _GEOM_KEYS)
+            coords = self._extract_coords_from_geom(geom) if geom else []
+            for area_code in record_areas:
+                area_counts[area_code] += 1
+                areas[area_code].extend(coords)
 
         # Create zones with convex hull
         zones = []
@@ -672,7 +909,8 @@ class ParkingDataTransformer:
                     area_code=area_code,
                     name=f"Area {area_code}",
                     polygon=[hull_polygon],
-                    total_blocks=len(coords)
+                    total_blocks=area_counts[area_code],
+                    bbox=self._polygon_bbox([hull_polygon]),
                 ))
 
         logger.info(f"Derived {len(zones)} zones using convex hull")
@@ -681,29 +919,39 @@ class ParkingDataTransformer:
     def _create_convex_hull(self, coords: List[Tuple[float, float]]) -> Optional[List[Tuple[float, float]]]:
         """
         Create a convex hull polygon from a set of coordinates.
-        Returns None if scipy is not available or if hull creation fails.
+
+        Uses the monotone chain kernel (Numba-compiled when available). Without
+        Numba, scipy's Qhull takes point sets above _QHULL_MIN_POINTS, where
+        its C code outruns the interpreted kernel; smaller sets stay on the
+        kernel, which avoids Qhull's fixed per-call overhead.
+        Returns None if NumPy is not available, if neither the kernel nor
+        scipy can be loaded, or if hull creation fails.
         """
-        if not SCIPY_AVAILABLE:
-            logger.debug("scipy not available, falling back to bounding box")
+        if not NUMPY_AVAILABLE:
+            logger.debug("NumPy not available, skipping convex hull")
             return None
 
         if len(coords) < 3:
             return None
 
         try:
-            import numpy as np
-            # Remove duplicates and convert to numpy array
-            unique_coords = list(set(coords))
-            if len(unique_coords) < 3:
+            # Remove duplicates (np.unique also sorts by (x, y), as the kernel needs)
+            points = np.unique(np.asarray(coords, dtype=np.float64), axis=0)
+            if len(points) < 3:
                 return None
 
-            points = np.array(unique_coords)
-
-            # Create convex hull
-            hull = ConvexHull(points)
-
             # Extract hull vertices in order
-            hull_points = points[hull.vertices]
+            use_qhull = SCIPY_AVAILABLE and (
+                not KERNELS_AVAILABLE or (not NUMBA_AVAILABLE and len(points) > _QHULL_MIN_POINTS)
+            )
+            if use_qhull:
+                hull_points = points[ConvexHull(points).vertices]
+            elif KERNELS_AVAILABLE:
+                hull_points = points[monotone_chain(points)]
+            else:
+                return None
+            if len(hull_points) < 3:
+                return None  # All points collinear
 
             # Convert to list of tuples and close the ring
             polygon = [(float(p[0]), float(p[1])) for p in hull_points]
@@ -734,19 +982,26 @@ class ParkingDataTransformer:
         return coords
 
     def _flatten_coords(self, raw: Any, coords: List[Tuple[float, float]]):
-        """Recursively flatten coordinate arrays"""
-        if not raw:
-            return
-        if isinstance(raw[0], (int, float)):
-            # This is a coordinate pair [lon, lat]
-            if len(raw) >= 2:
-                coords.append((float(raw[0]), float(raw[1])))
-        elif isinstance(raw[0], list):
-            # Nested array
-            for item in raw:
-                self._flatten_coords(item, coords)
-
-    def transform_blockface(self, raw_blockfaces: List[Dict[str, Any]]) -> List[ParkingRegulation]:
+        """Flatten nested coordinate arrays in order (explicit stack, no recursion)"""
+        stack = [raw]
+        while stack:
+            item = stack.pop()
+            if not item:
+                continue
+            first = item[0]
+            if isinstance(first, (int, float)):
+                # This is a coordinate pair [lon, lat]
+                if len(item) >= 2:
+                    coords.append((float(first), float(item[1])))
+            elif isinstance(first, list):
+                # Nested array - push children reversed so they pop in order
+                stack.extend(reversed(item))
+
+    def transform_blockface(
+        self,
+        raw_blockfaces: List[Dict[str, Any]],
+        group: bool = False
+    ) -> Union[List[ParkingRegulation], Tuple[List[ParkingRegulation], Dict[str, List[int]]]]:
         """
         Transform DataSF blockface data into ParkingRegulation objects.
         hi6h-neyh dataset field mappings:
@@ -756,48 +1011,57 @@ class ParkingDataTransformer:
         - hrs_begin/hrs_end or hours -> time range
         - hrlimit -> time limit in hours
         - shape -> geometry
+
+        With group=True, also returns an index of normalized RPP area ->
+        positions in the regulations list, built in the same pass so
+        generate_app_data doesn't have to re-walk the regulations.
         """
         logger.info(f"Transforming {len(raw_blockfaces)} blockface records")
         regulations = []
+        area_index: Dict[str, List[int]] = defaultdict(list)
 
         for record in raw_blockfaces:
-            try:
-                # Get RPP area from multiple possible fields
-                rpp_area = (record.get("rpparea1") or record.get("RPPAREA1") or
-                           record.get("rpp_area") or record.get("RPP_AREA"))
-
-                # Get time limit - hi6h-neyh uses 'hrlimit' in hours
-                time_limit = None
-                hrlimit = record.get("hrlimit") or record.get("HRLIMIT")
-                if hrlimit:
-                    try:
-                        time_limit = int(float(hrlimit)) * 60  # Convert hours to minutes
-                    except (ValueError, TypeError):
-                        time_limit = self._parse_time_limit(hrlimit)
-                else:
-                    time_limit = self._parse_time_limit(record.get("time_limit"))
-
-                regulation = ParkingRegulation(
-                    street_name=record.get("street") or record.get("STREET") or "",
-                    from_street=record.get("from_street") or record.get("FROM_STREET") or "",
-                    to_street=record.get("to_street") or record.get("TO_STREET") or "",
-                    side=record.get("side") or record.get("SIDE") or "",
-                    rpp_area=rpp_area,
-                    time_limit=time_limit,
-                    hours_begin=record.get("hrs_begin") or record.get("HRS_BEGIN") or record.get("hours_begin"),
-                    hours_end=record.get("hrs_end") or record.get("HRS_END") or record.get("hours_end"),
-                    days=self._parse_days(record.get("days") or record.get("DAYS") or ""),
-                    geometry=self._extract_geometry(record),
-                )
-
-                regulations.append(regulation)
+            # DataSF records use lower-case keys and ArcGIS exports upper-case ones;
+            # batches can mix both, so every field falls back to its alternates
+            get = record.get
 
-            except Exception as e:
-                logger.error(f"Error transforming blockface: {e}")
-                self.stats["errors"] += 1
+            # Get RPP area from multiple possible fields
+            rpp_area = get("rpparea1") or get("RPPAREA1") or get("rpp_area") or get("RPP_AREA")
+
+            # Get time limit - hi6h-neyh uses 'hrlimit' in hours
+            time_limit = None
+            hrlimit = get("hrlimit") or get("HRLIMIT")
+            if hrlimit:
+                try:
+                    time_limit = int(float(hrlimit)) * 60  # Convert hours to minutes
+                except (ValueError, TypeError, OverflowError):
+                    time_limit = self._parse_time_limit(hrlimit)
+            else:
+                time_limit = self._parse_time_limit(get("time_limit"))
+
+            days = get("days") or get("DAYS") or ""
+
+            regulation = ParkingRegulation(
+                street_name=_intern(get("street") or get("STREET") or ""),
+                from_street=_intern(get("from_street") or get("FROM_STREET") or ""),
+                to_street=_intern(get("to_street") or get("TO_STREET") or ""),
+                side=_intern(get("side") or get("SIDE") or ""),
+                rpp_area=_intern(rpp_area),
+                time_limit=time_limit,
+                hours_begin=get("hrs_begin") or get("HRS_BEGIN") or get("hours_begin"),
+                hours_end=get("hrs_end") or get("HRS_END") or get("hours_end"),
+                days=_parse_days(days if isinstance(days, str) else str(days)),
+                geometry=self._extract_geometry(record),
+            )
+
+            if group and rpp_area:
+                area_index[_norm_area(rpp_area)].append(len(regulations))
+            regulations.append(regulation)
 
         self.stats["regulations"] = len(regulations)
         logger.info(f"Transformed {len(regulations)} parking regulations")
+        if group:
+            return regulations, dict(area_index)
         return regulations
 
     def transform_meters(self, raw_meters: List[Dict[str, Any]]) -> List[ParkingMeter]:
@@ -805,46 +1069,52 @@ class ParkingDataTransformer:
         Transform DataSF parking meter data into ParkingMeter objects.
         """
         logger.info(f"Transforming {len(raw_meters)} meter records")
-        meters = []
-
-        for record in raw_meters:
-            try:
-                # Extract coordinates
-                lat = self._safe_float(record.get("latitude"))
-                lon = self._safe_float(record.get("longitude"))
-
-                if lat is None or lon is None:
-                    # Try to get from point geometry
-                    point = record.get("point")
-                    if point:
-                        lat = self._safe_float(point.get("latitude"))
-                        lon = self._safe_float(point.get("longitude"))
-
-                if lat is None or lon is None:
-                    continue
 
-                meter = ParkingMeter(
-                    post_id=record.get("post_id", ""),
-                    latitude=lat,
-                    longitude=lon,
-                    street_name=record.get("street_name", ""),
-                    street_num=record.get("street_num"),
-                    cap_color=record.get("cap_color", ""),
-                    time_limit=self._parse_meter_time_limit(record.get("cap_color")),
-                    rate_area=record.get("rate_area"),
-                )
-
-                meters.append(meter)
-
-            except Exception as e:
-                logger.error(f"Error transforming meter: {e}")
-                self.stats["errors"] += 1
+        # Coerce coordinates column-wise; records missing either one (or with an
+        # unparsable one) take both from their point geometry instead
+        lats = self._coerce_floats([record.get("latitude") for record in raw_meters])
+        lons = self._coerce_floats([record.get("longitude") for record in raw_meters])
+        if NUMPY_AVAILABLE:
+            fallback = np.flatnonzero(~(np.isfinite(lats) & np.isfinite(lons))).tolist()
+        else:
+            fallback = [i for i, (lat, lon) in enumerate(zip(lats, lons))
+                        if not (math.isfinite(lat) and math.isfinite(lon))]
+        for i in fallback:
+            lats[i], lons[i] = self._point_coords(raw_meters[i])
+
+        # Keep only records with both coordinates present
+        if NUMPY_AVAILABLE:
+            keep = np.flatnonzero(np.isfinite(lats) & np.isfinite(lons))
+            lats, lons, keep = lats[keep].tolist(), lons[keep].tolist(), keep.tolist()
+        else:
+            keep = [i for i, (lat, lon) in enumerate(zip(lats, lons))
+                    if math.isfinite(lat) and math.isfinite(lon)]
+            lats, lons = [lats[i] for i in keep], [lons[i] for i in keep]
+
+        # Every kept record yields a meter, so build the list in one sized pass
+        meters = [
+            ParkingMeter(
+                post_id=record.get("post_id", ""),
+                latitude=lat,
+                longitude=lon,
+                street_name=record.get("street_name", ""),
+                street_num=record.get("street_num"),
+                cap_color=record.get("cap_color", ""),
+                time_limit=self._parse_meter_time_limit(record.get("cap_color")),
+                rate_area=record.get("rate_area"),
+            )
+            for record, lat, lon in zip(map(raw_meters.__getitem__, keep), lats, lons)
+        ]
 
         self.stats["meters"] = len(meters)
         logger.info(f"Transformed {len(meters)} parking meters")
         return meters
 
-    def derive_metered_zones_from_meters(self, meters: List[ParkingMeter]) -> List[MeteredZone]:
+    def derive_metered_zones_from_meters(
+        self,
+        meters: List[ParkingMeter],
+        cache_dir: Optional[Union[str, os.PathLike]] = None
+    ) -> List[MeteredZone]:
         """
         Derive paid parking zones from meter locations by clustering nearby meters.
 
@@ -852,29 +1122,37 @@ class ParkingDataTransformer:
         - Divides the city into grid cells (~50m)
         - Each grid cell with meters becomes a separate zone
         - Creates axis-aligned rectangular polygons (right angles only)
+
+        With cache_dir, the derived zones are pickled there under a hash of the
+        meter fields they depend on, so re-runs over unchanged meters skip the
+        derivation (and its zone merge) entirely.
         """
         logger.info(f"Deriving metered zones from {len(meters)} meters")
 
         if not meters:
             return []
 
+        cache_path = None
+        if cache_dir:
+            cache_path = os.path.join(cache_dir, f"metered_zones_{self._meters_digest(meters)}.pkl")
+            try:
+                with open(cache_path, "rb") as f:
+                    zones = pickle.load(f)
+                logger.info(f"Loaded {len(zones)} metered zones from cache {cache_path}")
+                return zones
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                logger.warning(f"Ignoring unreadable metered zone cache {cache_path}: {e}")
+
         # Grid cell size in degrees (~50m at SF latitude)
         # Smaller cells = more granular zones, prevents mega-zones
         GRID_SIZE = 0.0005  # ~55m
         # Padding for bounding box (~10m)
         PADDING = 0.0001
 
-        # Group meters by grid cell
-        grid_cells: Dict[Tuple[int, int], List[ParkingMeter]] = {}
-
-        for meter in meters:
-            grid_x = int(meter.longitude / GRID_SIZE)
-            grid_y = int(meter.latitude / GRID_SIZE)
-            cell_key = (grid_x, grid_y)
-
-            if cell_key not in grid_cells:
-                grid_cells[cell_key] = []
-            grid_cells[cell_key].append(meter)
+        # Group meters by grid cell, with each cell's meter bounding box
+        grid_cells = self._group_meters_by_cell(meters, GRID_SIZE)
 
         logger.info(f"Grouped meters into {len(grid_cells)} grid cells")
 
@@ -882,15 +1160,15 @@ class ParkingDataTransformer:
         zones = []
         zone_counter = 0
 
-        for cell_key, zone_meters in grid_cells.items():
+        for zone_meters, (min_lon, min_lat, max_lon, max_lat) in grid_cells:
             if len(zone_meters) < 2:  # Skip cells with only 1 meter
                 continue
 
             # Create axis-aligned bounding box (rectangle with right angles)
-            min_lon = min(m.longitude for m in zone_meters) - PADDING
-            max_lon = max(m.longitude for m in zone_meters) + PADDING
-            min_lat = min(m.latitude for m in zone_meters) - PADDING
-            max_lat = max(m.latitude for m in zone_meters) + PADDING
+            min_lon -= PADDING
+            max_lon += PADDING
+            min_lat -= PADDING
+            max_lat += PADDING
 
             # Create rectangular polygon (4 corners, closed ring)
             # Order: bottom-left, bottom-right, top-right, top-left, close
@@ -904,20 +1182,30 @@ class ParkingDataTransformer:
 
             polygon_coords = [rect_coords]
 
-            # Calculate zone statistics
-            cap_colors = list(set(m.cap_color for m in zone_meters if m.cap_color))
-            time_limits = [m.time_limit for m in zone_meters if m.time_limit]
-            avg_time = int(sum(time_limits) / len(time_limits)) if time_limits else None
-            rate_areas = list(set(m.rate_area for m in zone_meters if m.rate_area))
+            # Calculate zone statistics in one pass over the cell's meters
+            # (dicts as ordered sets, so colors and rate area follow meter order)
+            cap_colors_seen: Dict[str, None] = {}
+            rate_areas_seen: Dict[str, None] = {}
+            street_counts: Dict[str, int] = {}
+            time_sum = time_count = 0
+            for m in zone_meters:
+                if m.cap_color:
+                    cap_colors_seen[m.cap_color] = None
+                if m.time_limit:
+                    time_sum += m.time_limit
+                    time_count += 1
+                if m.rate_area:
+                    rate_areas_seen[m.rate_area] = None
+                if m.street_name:
+                    street_counts[m.street_name] = street_counts.get(m.street_name, 0) + 1
+            cap_colors = list(cap_colors_seen)
+            avg_time = int(time_sum / time_count) if time_count else None
+            rate_areas = list(rate_areas_seen)
 
             zone_counter += 1
             zone_id = f"METERED_{zone_counter:04d}"
 
             # Determine zone name from predominant street or rate area
-            street_counts: Dict[str, int] = {}
-            for m in zone_meters:
-                if m.street_name:
-                    street_counts[m.street_name] = street_counts.get(m.street_name, 0) + 1
             primary_street = max(street_counts, key=street_counts.get) if street_counts else "Unknown"
             zone_name = f"Metered - {primary_street}"
 
@@ -937,8 +1225,74 @@ class ParkingDataTransformer:
         # Merge adjacent/overlapping metered zones
         zones = self._merge_metered_zones(zones)
 
+        if cache_path:
+            try:
+                os.makedirs(cache_dir, exist_ok=True)
+                tmp_path = f"{cache_path}.tmp"
+                with open(tmp_path, "wb") as f:
+                    pickle.dump(zones, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_path, cache_path)  # Atomic, so readers never see a partial file
+            except OSError as e:
+                logger.warning(f"Failed to write metered zone cache {cache_path}: {e}")
+
         return zones
 
+    def _meters_digest(self, meters: List[ParkingMeter]) -> str:
+        """Hash of every meter field metered-zone derivation reads (plus the cache version)"""
+        fields = [
+            (m.latitude, m.longitude, m.street_name, m.cap_color, m.time_limit, m.rate_area)
+            for m in meters
+        ]
+        return hashlib.blake2b(
+            repr((_METERED_ZONE_CACHE_VERSION, fields)).encode(), digest_size=16
+        ).hexdigest()
+
+    def _group_meters_by_cell(
+        self, meters: List[ParkingMeter], grid_size: float
+    ) -> List[Tuple[List[ParkingMeter], Tuple[float, float, float, float]]]:
+        """
+        Group meters into grid cells (cell = coordinate / grid_size, truncated).
+        Returns (meters, (min_lon, min_lat, max_lon, max_lat)) per cell, cells in
+        order of first appearance and meters in input order.
+        """
+        if not NUMPY_AVAILABLE:
+            grid_cells: Dict[Tuple[int, int], List[ParkingMeter]] = defaultdict(list)
+            for meter in meters:
+                grid_cells[(int(meter.longitude / grid_size), int(meter.latitude / grid_size))].append(meter)
+            return [
+                (cell_meters, (
+                    min(m.longitude for m in cell_meters), min(m.latitude for m in cell_meters),
+                    max(m.longitude for m in cell_meters), max(m.latitude for m in cell_meters),
+                ))
+                for cell_meters in grid_cells.values()
+            ]
+
+        # Struct-of-arrays coordinates; cell ids truncate toward zero like int()
+        n = len(meters)
+        lons = np.fromiter((m.longitude for m in meters), dtype=np.float64, count=n)
+        lats = np.fromiter((m.latitude for m in meters), dtype=np.float64, count=n)
+        # (packed into one int64 key: x in the high 32 bits, y in the low 32)
+        grid_x = np.trunc(lons / grid_size).astype(np.int64)
+        grid_y = np.trunc(lats / grid_size).astype(np.int64)
+        keys = (grid_x << 32) | (grid_y & 0xFFFFFFFF)
+        _, first, inverse, counts = np.unique(keys, return_index=True, return_inverse=True, return_counts=True)
+
+        # Sort meters into contiguous runs per cell, then reduce each run's bbox in one pass
+        order = np.argsort(inverse, kind="stable")
+        starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+        bboxes = np.stack([
+            np.minimum.reduceat(lons[order], starts), np.minimum.reduceat(lats[order], starts),
+            np.maximum.reduceat(lons[order], starts), np.maximum.reduceat(lats[order], starts),
+        ], axis=1).tolist()
+
+        order = order.tolist()
+        starts = starts.tolist()
+        counts = counts.tolist()
+        return [
+            ([meters[i] for i in order[starts[c]:starts[c] + counts[c]]], tuple(bboxes[c]))
+            for c in np.argsort(first, kind="stable").tolist()
+        ]
+
     def _merge_metered_zones(self, zones: List[MeteredZone]) -> List[MeteredZone]:
         """
         Merge adjacent or overlapping metered zones into larger zones.
@@ -999,27 +1353,31 @@ class ParkingDataTransformer:
 
             merged_polys = extract_polygons(merged)
 
-            for poly in merged_polys:
+            # Find which original zones contributed to each merged polygon with one
+            # bulk STRtree query (pairs come back as [merged_idx, original_idx])
+            tree = shapely.STRtree(shapely_polys)
+            pairs = tree.query(merged_polys, predicate="intersects")
+            pairs = pairs[:, np.lexsort((pairs[1], pairs[0]))]
+            contributors: List[List[int]] = [[] for _ in merged_polys]
+            for merged_idx, orig_idx in zip(pairs[0].tolist(), pairs[1].tolist()):
+                contributors[merged_idx].append(orig_idx)
+
+            for poly, orig_indices in zip(merged_polys, contributors):
                 zone_counter += 1
-                # Find which original zones contributed to this merged polygon
-                contributing_meta = []
-                for i, orig_poly in enumerate(shapely_polys):
-                    if poly.intersects(orig_poly):
-                        contributing_meta.append(zone_metadata[i])
+                contributing_meta = [zone_metadata[i] for i in orig_indices]
 
                 # Aggregate metadata from contributing zones
                 total_meters = sum(m["meter_count"] for m in contributing_meta)
-                all_colors = list(set(c for m in contributing_meta for c in m["cap_colors"]))
+                all_colors = list(dict.fromkeys(c for m in contributing_meta for c in m["cap_colors"]))
                 all_times = [t for m in contributing_meta for t in m["time_limits"] if t]
                 avg_time = int(sum(all_times) / len(all_times)) if all_times else None
-                rate_areas = list(set(m["rate_area"] for m in contributing_meta if m["rate_area"]))
+                rate_areas = list(dict.fromkeys(m["rate_area"] for m in contributing_meta if m["rate_area"]))
 
-                # Create merged zone
-                coords = [(c[0], c[1]) for c in poly.exterior.coords]
+                # Create merged zone (ring stored as an (N, 2) float64 array, like RPP zones)
                 result_zones.append(MeteredZone(
                     zone_id=f"METERED_{zone_counter:04d}",
                     name="Paid Parking",
-                    polygon=[coords],
+                    polygon=[self._ring_to_array(poly.exterior.coords)],
                     meter_count=total_meters,
                     cap_colors=all_colors,
                     avg_time_limit=avg_time,
@@ -1038,94 +1396,123 @@ class ParkingDataTransformer:
         zones: List[RPPZone],
         regulations: List[ParkingRegulation],
         meters: List[ParkingMeter],
-        metered_zones: Optional[List[MeteredZone]] = None
+        metered_zones: Optional[List[MeteredZone]] = None,
+        columnar_meters: bool = False,
+        rings_as_lists: bool = True,
+        regulation_index: Optional[Dict[str, List[int]]] = None,
+        quantize_scale: Optional[int] = None,
+        grid_cell_size: Optional[float] = None
     ) -> Dict[str, Any]:
         """
         Generate the final data structure for the iOS app.
+
+        Pass regulation_index from transform_blockface(group=True) to reuse
+        its per-area grouping instead of re-scanning the regulations.
+
+        With columnar_meters=True, "meters" is emitted as parallel arrays
+        ({"ids": [...], "lats": [...], ...}) instead of one object per meter.
+        With rings_as_lists=False, NumPy coordinate rings are left as arrays
+        (for serializers that handle them natively, e.g. orjson).
+        With quantize_scale (e.g. 1_000_000), zone polygons are emitted as
+        integer offsets plus a per-zone "transform" of {"scale", "translate"};
+        decode with lon = x / scale + translate[0], lat = y / scale + translate[1].
+        With grid_cell_size (degrees, e.g. 0.005 for ~500m), a "zoneGridIndex"
+        maps grid cells to the codes of zones whose ring bboxes touch them,
+        so point lookups only test those zones' polygons.
         """
         logger.info("Generating app data bundle")
 
-        # Group regulations by RPP area
-        regulations_by_area: Dict[str, List[Dict]] = {}
-        for reg in regulations:
-            if reg.rpp_area:
-                area = reg.rpp_area.upper()
-                if area not in regulations_by_area:
-                    regulations_by_area[area] = []
-                regulations_by_area[area].append({
-                    "street": reg.street_name,
-                    "from": reg.from_street,
-                    "to": reg.to_street,
-                    "side": reg.side,
-                    "timeLimit": reg.time_limit,
-                    "hoursBegin": reg.hours_begin,
-                    "hoursEnd": reg.hours_end,
-                    "days": reg.days,
-                })
+        # Tally regulations per RPP area (only the aggregates are emitted)
+        block_counts: Counter = Counter()
+        time_limits_by_area: Dict[str, Counter] = defaultdict(Counter)
+        if regulation_index is not None:
+            for area, indices in regulation_index.items():
+                block_counts[area] = len(indices)
+                for i in indices:
+                    if regulations[i].time_limit:
+                        time_limits_by_area[area][regulations[i].time_limit] += 1
+        else:
+            for reg in regulations:
+                if reg.rpp_area:
+                    area = _norm_area(reg.rpp_area)
+                    block_counts[area] += 1
+                    if reg.time_limit:
+                        time_limits_by_area[area][reg.time_limit] += 1
+
+        # Most common time limit (mode) for non-permit holders, per area
+        mode_limits = {
+            area: limits.most_common(1)[0][0]
+            for area, limits in time_limits_by_area.items()
+        }
 
         # Build RPP zones data
-        zones_data = []
-        total_multi_permit = 0
-        for zone in zones:
-            # Convert multi_permit_polygons dict keys to strings for JSON
-            mp_polygons = {str(k): v for k, v in zone.multi_permit_polygons.items()}
-            total_multi_permit += len(mp_polygons)
-
-            # Calculate most common time limit for non-permit holders in this zone
-            zone_regs = regulations_by_area.get(zone.area_code, [])
-            time_limits = [r.get("timeLimit") for r in zone_regs if r.get("timeLimit")]
-            if time_limits:
-                # Use most common time limit (mode)
-                from collections import Counter
-                most_common_limit = Counter(time_limits).most_common(1)[0][0]
-            else:
-                most_common_limit = 120  # Default 2 hours
-
-            zones_data.append({
+        zones_data = [
+            {
                 "code": zone.area_code,
                 "name": zone.name,
-                "polygon": zone.polygon,
+                "polygon": self._polygon_to_list(zone.polygon) if rings_as_lists else zone.polygon,
+                "bbox": list(zone.bbox) if zone.bbox != _EMPTY_BBOX else list(self._polygon_bbox(zone.polygon)),
                 "neighborhoods": zone.neighborhoods,
-                "blockCount": len(zone_regs),
+                "blockCount": block_counts[zone.area_code],
                 "zoneType": "rpp",  # Residential Permit Parking
-                "multiPermitPolygons": mp_polygons,  # Index -> list of valid permit areas
-                "nonPermitTimeLimit": most_common_limit,  # Minutes, limit for non-permit holders
-            })
+                # Index -> list of valid permit areas (string keys for JSON)
+                "multiPermitPolygons": {str(k): v for k, v in zone.multi_permit_polygons.items()},
+                "nonPermitTimeLimit": mode_limits.get(zone.area_code, 120),  # Minutes, default 2 hours
+            }
+            for zone in zones
+        ]
+        total_multi_permit = sum(len(zone.multi_permit_polygons) for zone in zones)
         logger.info(f"Total multi-permit polygons across all zones: {total_multi_permit}")
 
         # Build metered zones data
-        metered_zones_data = []
-        if metered_zones:
-            for mz in metered_zones:
-                metered_zones_data.append({
-                    "code": mz.zone_id,
-                    "name": mz.name,
-                    "polygon": mz.polygon,
-                    "meterCount": mz.meter_count,
-                    "capColors": mz.cap_colors,
-                    "avgTimeLimit": mz.avg_time_limit,
-                    "rateArea": mz.rate_area,
-                    "zoneType": "metered",  # Paid parking
-                })
+        metered_zones_data = [
+            {
+                "code": mz.zone_id,
+                "name": mz.name,
+                "polygon": self._polygon_to_list(mz.polygon) if rings_as_lists else mz.polygon,
+                "bbox": list(self._polygon_bbox(mz.polygon)),
+                "meterCount": mz.meter_count,
+                "capColors": mz.cap_colors,
+                "avgTimeLimit": mz.avg_time_limit,
+                "rateArea": mz.rate_area,
+                "zoneType": "metered",  # Paid parking
+            }
+            for mz in metered_zones or ()
+        ]
+        if metered_zones_data:
             logger.info(f"Added {len(metered_zones_data)} metered zones to app data")
 
-        # Build output
-        return {
-            "version": datetime.utcnow().strftime("%Y%m%d"),
-            "generated": datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ"),
+        zone_grid_index = None
+        if grid_cell_size:
+            zone_grid_index = self._build_zone_grid_index(
+                chain(
+                    ((zone.area_code, zone.polygon) for zone in zones),
+                    ((mz.zone_id, mz.polygon) for mz in metered_zones or ()),
+                ),
+                grid_cell_size,
+            )
+
+        if quantize_scale:
+            for zone_data, polygon in chain(
+                zip(zones_data, (zone.polygon for zone in zones)),
+                zip(metered_zones_data, (mz.polygon for mz in metered_zones or ())),
+            ):
+                zone_data["polygon"], zone_data["transform"] = self._quantize_polygon(polygon, quantize_scale)
+
+        # Build meters data
+        if columnar_meters:
+            meters_data: Any = self._meters_to_columns(meters)
+        else:
+            meters_data = self._meters_to_rows(meters)
+
+        # Build output (single timestamp so version and generated always agree)
+        now = datetime.utcnow()
+        app_data = {
+            "version": now.strftime("%Y%m%d"),
+            "generated": now.strftime("%Y-%m-%dT%H:%M:%SZ"),
             "zones": zones_data,
             "meteredZones": metered_zones_data,
-            "meters": [
-                {
-                    "id": m.post_id,
-                    "lat": m.latitude,
-                    "lon": m.longitude,
-                    "street": m.street_name,
-                    "capColor": m.cap_color,
-                    "timeLimit": m.time_limit,
-                }
-                for m in meters
-            ],
+            "meters": meters_data,
             "stats": {
                 "totalZones": len(zones),
                 "totalMeteredZones": len(metered_zones_data),
@@ -1133,16 +1520,294 @@ class ParkingDataTransformer:
                 "totalRegulations": len(regulations),
             }
         }
+        if zone_grid_index is not None:
+            app_data["zoneGridIndex"] = zone_grid_index
+        return app_data
+
+    def generate_app_data_bytes(
+        self,
+        zones: List[RPPZone],
+        regulations: List[ParkingRegulation],
+        meters: List[ParkingMeter],
+        metered_zones: Optional[List[MeteredZone]] = None,
+        columnar_meters: bool = False
+    ) -> bytes:
+        """
+        Generate the app data bundle serialized as compact JSON bytes.
+
+        Uses orjson when available, which writes NumPy rings directly and
+        skips the intermediate .tolist() pass. Falls back to stdlib json.
+        """
+        if ORJSON_AVAILABLE:
+            app_data = self.generate_app_data(
+                zones, regulations, meters, metered_zones,
+                columnar_meters=columnar_meters, rings_as_lists=False
+            )
+            return orjson.dumps(app_data, option=orjson.OPT_SERIALIZE_NUMPY)
+
+        app_data = self.generate_app_data(
+            zones, regulations, meters, metered_zones, columnar_meters=columnar_meters
+        )
+        return json.dumps(app_data, separators=(",", ":")).encode()
+
+    def write_app_data(
+        self,
+        fp: BinaryIO,
+        zones: List[RPPZone],
+        regulations: List[ParkingRegulation],
+        meters: List[ParkingMeter],
+        metered_zones: Optional[List[MeteredZone]] = None
+    ) -> None:
+        """
+        Stream the app data bundle as compact JSON to a binary file object.
+
+        Produces the same document as generate_app_data_bytes, but meter rows
+        are built and encoded _METER_CHUNK_SIZE at a time, so the full list of
+        meter dicts (the bulk of the bundle) is never held in memory at once.
+        """
+        if ORJSON_AVAILABLE:
+            def dumps(obj: Any) -> bytes:
+                return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+        else:
+            def dumps(obj: Any) -> bytes:
+                return json.dumps(obj, separators=(",", ":")).encode()
+
+        app_data = self.generate_app_data(
+            zones, regulations, [], metered_zones, rings_as_lists=not ORJSON_AVAILABLE
+        )
+        app_data["stats"]["totalMeters"] = len(meters)
+
+        fp.write(b"{")
+        for i, (key, value) in enumerate(app_data.items()):
+            if i:
+                fp.write(b",")
+            fp.write(dumps(key) + b":")
+            if key != "meters":
+                fp.write(dumps(value))
+                continue
+
+            # Each chunk is encoded as a list, then written without its brackets
+            fp.write(b"[")
+            for start in range(0, len(meters), _METER_CHUNK_SIZE):
+                if start:
+                    fp.write(b",")
+                fp.write(dumps(self._meters_to_rows(meters[start:start + _METER_CHUNK_SIZE]))[1:-1])
+            fp.write(b"]")
+        fp.write(b"}")
+
+    def generate_app_data_v2(
+        self,
+        zones: List[RPPZone],
+        regulations: List[ParkingRegulation],
+        meters: List[ParkingMeter],
+        metered_zones: Optional[List[MeteredZone]] = None,
+        columnar_meters: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Generate the app data bundle with compact binary polygons.
+
+        Same structure as generate_app_data, except each zone "polygon" is
+        {"coords": <base64 little-endian float32 lon,lat pairs>,
+         "ringOffsets": [0, len(ring0), len(ring0) + len(ring1), ...]}
+        where offsets count points and the last entry is the total.
+        """
+        app_data = self.generate_app_data(
+            zones, regulations, meters, metered_zones,
+            columnar_meters=columnar_meters, rings_as_lists=False
+        )
+        for zone_data in app_data["zones"]:
+            zone_data["polygon"] = self._encode_polygon(zone_data["polygon"])
+        for zone_data in app_data["meteredZones"]:
+            zone_data["polygon"] = self._encode_polygon(zone_data["polygon"])
+        app_data["polygonEncoding"] = "float32le-base64"
+        return app_data
+
+    def meters_to_table(self, meters: List[ParkingMeter]) -> "pa.Table":
+        """Convert meters to a pyarrow Table with METER_SCHEMA"""
+        self._require_pyarrow()
+        columns = [
+            [m.post_id for m in meters],
+            [m.latitude for m in meters],
+            [m.longitude for m in meters],
+            [m.street_name for m in meters],
+            [m.cap_color for m in meters],
+            [m.time_limit for m in meters],
+            [m.rate_area for m in meters],
+        ]
+        return self._build_table(columns, METER_SCHEMA)
+
+    def regulations_to_table(self, regulations: List[ParkingRegulation]) -> "pa.Table":
+        """Convert regulations to a pyarrow Table with REGULATION_SCHEMA (geometry is not included)"""
+        self._require_pyarrow()
+        columns = [
+            [r.street_name for r in regulations],
+            [r.from_street for r in regulations],
+            [r.to_street for r in regulations],
+            [r.side for r in regulations],
+            [r.rpp_area for r in regulations],
+            [r.time_limit for r in regulations],
+            [r.hours_begin for r in regulations],
+            [r.hours_end for r in regulations],
+            [list(r.days) for r in regulations],
+        ]
+        return self._build_table(columns, REGULATION_SCHEMA)
+
+    def write_parquet(self, table: "pa.Table", path: str) -> None:
+        """Write a table from meters_to_table/regulations_to_table to a Parquet file"""
+        self._require_pyarrow()
+        pq.write_table(table, path, compression="zstd")
+        logger.info(f"Wrote {table.num_rows} rows to {path}")
 
     # Helper methods
 
+    def _require_pyarrow(self):
+        """Raise ImportError if pyarrow is not installed"""
+        if not PYARROW_AVAILABLE:
+            raise ImportError("pyarrow is required for columnar export (pip install pyarrow)")
+
+    def _build_table(self, columns: List[List[Any]], schema: "pa.Schema") -> "pa.Table":
+        """Build a Table from per-field value lists, dictionary-encoding where the schema asks for it"""
+        arrays = []
+        for values, schema_field in zip(columns, schema):
+            if pa.types.is_dictionary(schema_field.type):
+                arrays.append(pa.array(values, type=schema_field.type.value_type).dictionary_encode())
+            else:
+                arrays.append(pa.array(values, type=schema_field.type))
+        return pa.Table.from_arrays(arrays, schema=schema)
+
     def _extract_neighborhoods(self, attrs: Dict[str, Any]) -> List[str]:
         """Extract neighborhood names from attributes"""
-        neighborhoods = []
-        for key in ["NEIGHBORHOOD", "neighborhood", "NHOOD", "nhood"]:
-            if key in attrs and attrs[key]:
-                neighborhoods.append(attrs[key])
-        return neighborhoods
+        return [attrs[key] for key in _NBHD_KEYS if attrs.get(key)]
+
+    def _ring_to_array(self, ring: List[List[float]]) -> Any:
+        """Convert a coordinate ring to an (N, 2) float64 array of (lon, lat)"""
+        if NUMPY_AVAILABLE:
+            try:
+                arr = np.asarray(ring, dtype=np.float64)
+                if arr.ndim == 2 and arr.shape[1] >= 2:
+                    return np.ascontiguousarray(arr[:, :2])
+            except ValueError:
+                # Ragged ring (mixed 2D/3D coords) - stream the (lon, lat) pairs straight into the buffer
+                n = len(ring)
+                return np.fromiter(
+                    chain.from_iterable((coord[0], coord[1]) for coord in ring), dtype=np.float64, count=2 * n
+                ).reshape(n, 2)
+        return [(coord[0], coord[1]) for coord in ring]
+
+    def _polygon_bbox(self, polygon: List[Any]) -> Tuple[float, float, float, float]:
+        """Bounding box (min_lon, min_lat, max_lon, max_lat) over all rings of a polygon"""
+        rings = [ring for ring in polygon if len(ring)]
+        if not rings:
+            return _EMPTY_BBOX
+        if NUMPY_AVAILABLE:
+            points = np.concatenate([np.asarray(ring, dtype=np.float64)[:, :2] for ring in rings])
+            mins, maxs = points.min(axis=0), points.max(axis=0)
+            return (float(mins[0]), float(mins[1]), float(maxs[0]), float(maxs[1]))
+        lons = [c[0] for ring in rings for c in ring]
+        lats = [c[1] for ring in rings for c in ring]
+        return (min(lons), min(lats), max(lons), max(lats))
+
+    def _encode_polygon(self, polygon: List[Any]) -> Dict[str, Any]:
+        """Pack polygon rings into one base64 float32 (little-endian) buffer plus ring offsets"""
+        offsets = [0]
+        for ring in polygon:
+            offsets.append(offsets[-1] + len(ring))
+
+        if NUMPY_AVAILABLE:
+            rings = [np.asarray(ring, dtype="<f4").reshape(-1, 2) for ring in polygon if len(ring)]
+            buffer = np.concatenate(rings).tobytes() if rings else b""
+        else:
+            packed = array("f", [c for ring in polygon for coord in ring for c in coord[:2]])
+            if sys.byteorder == "big":
+                packed.byteswap()
+            buffer = packed.tobytes()
+
+        return {"coords": base64.b64encode(buffer).decode("ascii"), "ringOffsets": offsets}
+
+    def _build_zone_grid_index(self, coded_polygons: Iterable[Tuple[str, List[Any]]], cell_size: float) -> Dict[str, Any]:
+        """
+        Build a coarse grid index of cell id -> zone codes.
+        Cell ids are row * cols + col, counted from the south-west corner of bbox.
+        """
+        entries = [
+            (code, self._polygon_bbox([ring]))
+            for code, polygon in coded_polygons
+            for ring in polygon if len(ring)
+        ]
+        if not entries:
+            return {"bbox": [0.0, 0.0, 0.0, 0.0], "cellSize": cell_size, "cols": 0, "rows": 0, "cells": {}}
+
+        min_lon = min(bbox[0] for _, bbox in entries)
+        min_lat = min(bbox[1] for _, bbox in entries)
+        max_lon = max(bbox[2] for _, bbox in entries)
+        max_lat = max(bbox[3] for _, bbox in entries)
+        cols = int((max_lon - min_lon) // cell_size) + 1
+        rows = int((max_lat - min_lat) // cell_size) + 1
+
+        cells: Dict[str, List[str]] = defaultdict(list)
+        for code, (ring_min_lon, ring_min_lat, ring_max_lon, ring_max_lat) in entries:
+            col_start = int((ring_min_lon - min_lon) // cell_size)
+            col_end = int((ring_max_lon - min_lon) // cell_size)
+            for row in range(int((ring_min_lat - min_lat) // cell_size), int((ring_max_lat - min_lat) // cell_size) + 1):
+                for col in range(col_start, col_end + 1):
+                    codes = cells[str(row * cols + col)]
+                    if not codes or codes[-1] != code:  # Rings of one zone arrive together
+                        codes.append(code)
+
+        logger.info(f"Built zone grid index: {cols}x{rows} cells, {len(cells)} occupied")
+        return {
+            "bbox": [min_lon, min_lat, max_lon, max_lat],
+            "cellSize": cell_size,
+            "cols": cols,
+            "rows": rows,
+            "cells": dict(cells),
+        }
+
+    def _quantize_polygon(self, polygon: List[Any], scale: int) -> Tuple[List[Any], Dict[str, Any]]:
+        """Quantize rings to integer offsets from the polygon's south-west corner (topojson-style)"""
+        min_lon, min_lat, _, _ = self._polygon_bbox(polygon)
+        transform = {"scale": scale, "translate": [min_lon, min_lat]}
+        if NUMPY_AVAILABLE:
+            origin = np.array([min_lon, min_lat])
+            rings = [
+                np.rint((np.asarray(ring, dtype=np.float64)[:, :2] - origin) * scale).astype(np.int32).tolist()
+                for ring in polygon if len(ring)
+            ]
+        else:
+            rings = [
+                [[round((c[0] - min_lon) * scale), round((c[1] - min_lat) * scale)] for c in ring]
+                for ring in polygon if len(ring)
+            ]
+        return rings, transform
+
+    def _polygon_to_list(self, polygon: List[Any]) -> List[Any]:
+        """Convert polygon rings to JSON-serializable lists"""
+        return [ring.tolist() if hasattr(ring, "tolist") else ring for ring in polygon]
+
+    def _meters_to_rows(self, meters: List[ParkingMeter]) -> List[Dict[str, Any]]:
+        """Convert meters to the app's row layout (one object per meter)"""
+        return [
+            {
+                "id": m.post_id,
+                "lat": m.latitude,
+                "lon": m.longitude,
+                "street": m.street_name,
+                "capColor": m.cap_color,
+                "timeLimit": m.time_limit,
+            }
+            for m in meters
+        ]
+
+    def _meters_to_columns(self, meters: List[ParkingMeter]) -> Dict[str, List[Any]]:
+        """Convert meters to a struct-of-arrays layout (one list per field)"""
+        return {
+            "ids": [m.post_id for m in meters],
+            "lats": [m.latitude for m in meters],
+            "lons": [m.longitude for m in meters],
+            "streets": [m.street_name for m in meters],
+            "capColors": [m.cap_color for m in meters],
+            "timeLimits": [m.time_limit for m in meters],
+        }
 
     def _parse_time_limit(self, value: Any) -> Optional[int]:
         """Parse time limit string to minutes"""
@@ -1151,28 +1816,29 @@ class ParkingDataTransformer:
         try:
             if isinstance(value, (int, float)):
                 return int(value)
-            value = str(value).upper()
+            value = str(value)
+            match = _TIME_LIMIT_RE.fullmatch(value)
+            if match:
+                amount = int(match.group(1))
+                unit = match.group(2)
+                return amount * 60 if unit and unit[0] in "Hh" else amount
+            # Digits before the first hour/minute marker, or all digits without one
+            value = value.upper()
             if "HR" in value or "HOUR" in value:
                 hours = int("".join(filter(str.isdigit, value.split("HR")[0].split("HOUR")[0])) or "0")
                 return hours * 60
             if "MIN" in value:
                 return int("".join(filter(str.isdigit, value.split("MIN")[0])) or "0")
             return int("".join(filter(str.isdigit, value)) or "0")
-        except (ValueError, TypeError):
+        except (ValueError, TypeError, OverflowError):  # OverflowError: int(float("inf"))
             return None
 
-    def _parse_days(self, days_str: str) -> List[str]:
-        """Parse days string into list"""
-        if not days_str:
-            return []
-        return [d.strip() for d in days_str.split(",") if d.strip()]
-
     def _extract_geometry(self, record: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Extract geometry from record if present"""
-        # hi6h-neyh dataset uses 'shape' field
-        for key in ["shape", "the_geom", "geometry"]:
-            if key in record:
-                return record[key]
+        for key in _GEOM_KEYS:
+            geom = record.get(key)
+            if geom is not None:
+                return geom
         return None
 
     def _safe_float(self, value: Any) -> Optional[float]:
@@ -1184,18 +1850,39 @@ class ParkingDataTransformer:
         except (ValueError, TypeError):
             return None
 
+    def _coerce_floats(self, values: List[Any]) -> Any:
+        """
+        Coerce a column of values to floats. Missing/invalid values become NaN.
+        Returns a float64 array when NumPy is available, else a list.
+        """
+        if NUMPY_AVAILABLE:
+            try:
+                arr = np.asarray(values, dtype=np.float64)  # Parses numeric strings in C
+                if arr.ndim == 1:
+                    return arr
+            except (ValueError, TypeError):
+                pass  # Some value is unparsable - coerce one by one below
+        nan = float("nan")
+        floats = [nan if (f := self._safe_float(v)) is None else f for v in values]
+        return np.asarray(floats, dtype=np.float64) if NUMPY_AVAILABLE else floats
+
+    def _point_coords(self, record: Dict[str, Any]) -> Tuple[float, float]:
+        """(lat, lon) from the record's point geometry, NaN where missing or invalid"""
+        point = record.get("point")
+        if not isinstance(point, dict):
+            return float("nan"), float("nan")
+        lat = self._safe_float(point.get("latitude"))
+        lon = self._safe_float(point.get("longitude"))
+        return (float("nan") if lat is None else lat), (float("nan") if lon is None else lon)
+
     def _parse_meter_time_limit(self, cap_color: Optional[str]) -> Optional[int]:
         """Infer time limit from cap color"""
-        if not cap_color:
+        if not cap_color or not isinstance(cap_color, str):
             return None
-        color_limits = {
-            "GREEN": 15,     # Short-term
-            "YELLOW": 30,    # Commercial loading
-            "GREY": 60,      # Standard 1hr
-            "GRAY": 60,
-            "BROWN": 120,    # Tour bus
-        }
-        return color_limits.get(cap_color.upper())
+        limit = _COLOR_LIMITS.get(cap_color)
+        if limit is None:
+            limit = _COLOR_LIMITS.get(cap_color.upper())  # Unusual casing, e.g. "gREY"
+        return limit
 
     def get_stats(self) -> Dict[str, int]:
         """Return transformation statistics"""